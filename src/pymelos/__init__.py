@@ -8,7 +8,11 @@ A Melos-like monorepo management tool for Python, providing:
 - VS Code integration
 """
 
-from pymelos.config import PyMelosConfig, load_config
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pymelos.errors import (
     BootstrapError,
     ConfigurationError,
@@ -23,16 +27,33 @@ from pymelos.errors import (
     ValidationError,
     WorkspaceNotFoundError,
 )
-from pymelos.execution import (
-    BatchResult,
-    ExecutionResult,
-    ExecutionStatus,
-    ParallelExecutor,
-)
-from pymelos.workspace import DependencyGraph, Package, Workspace
+
+if TYPE_CHECKING:
+    from pymelos.config import PyMelosConfig, load_config
+    from pymelos.execution import (
+        BatchResult,
+        ExecutionResult,
+        ExecutionStatus,
+        ParallelExecutor,
+    )
+    from pymelos.workspace import DependencyGraph, Package, Workspace
 
 __version__ = "0.1.2"
 
+# Heavier submodules (pydantic models, asyncio execution) are imported on
+# first attribute access so `pymelos --version` and `--help` stay fast.
+_LAZY_IMPORTS = {
+    "PyMelosConfig": "pymelos.config",
+    "load_config": "pymelos.config",
+    "BatchResult": "pymelos.execution",
+    "ExecutionResult": "pymelos.execution",
+    "ExecutionStatus": "pymelos.execution",
+    "ParallelExecutor": "pymelos.execution",
+    "DependencyGraph": "pymelos.workspace",
+    "Package": "pymelos.workspace",
+    "Workspace": "pymelos.workspace",
+}
+
 __all__ = [
     # Version
     "__version__",
@@ -61,3 +82,16 @@ __all__ = [
     "PublishError",
     "ValidationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from pymelos.errors import PyMelosError
-from pymelos.workspace import Workspace
+
+if TYPE_CHECKING:
+    from pymelos.workspace import Workspace
 
 
 def version_callback(value: bool) -> None:
@@ -53,6 +55,8 @@ def parse_comma_list(value: str | None) -> list[str] | None:
 
 def get_workspace(path: Path | None = None) -> Workspace:
     """Load workspace from current directory or specified path."""
+    from pymelos.workspace import Workspace
+
     try:
         return Workspace.discover(path)
     except PyMelosError as e:
@@ -165,7 +169,7 @@ def run_cmd(
             topological=not no_topological,
         )
 
-        for r in result:
+        for r in result.results:
             if r.success:
                 console.print(f"[green]✓[/green] [{r.package_name}] ({r.duration_ms}ms)")
             else:
@@ -174,7 +178,7 @@ def run_cmd(
                     console.print(r.stderr)
 
         if result.all_success:
-            console.print(f"\n[green]All {len(result)} packages passed[/green]")
+            console.print(f"\n[green]All {len(result.results)} packages passed[/green]")
         else:
             console.print(
                 f"\n[red]{result.failure_count} failed, {result.success_count} passed[/red]"
@@ -225,7 +229,7 @@ def exec_cmd(
             fail_fast=fail_fast,
         )
 
-        for r in result:
+        for r in result.results:
             console.print(f"\n[bold][{r.package_name}][/bold]")
             if r.stdout:
                 console.print(r.stdout)
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import subprocess
 from pathlib import Path
+from string import Template
 
 from pymelos.errors import ConfigurationError
 
-DEFAULT_PYMELOS_YAML = """# pymelos workspace configuration
-name: {name}
+DEFAULT_PYMELOS_YAML = Template("""# pymelos workspace configuration
+name: $name
 
 packages:
   - packages/*
@@ -52,26 +54,54 @@ clean:
 
 versioning:
   commit_format: conventional
-  tag_format: "{{name}}@{{version}}"
+  tag_format: "{name}@{version}"
   changelog:
     enabled: true
     filename: CHANGELOG.md
-"""
+""")
 
-DEFAULT_PYPROJECT_TOML = """[project]
-name = "{name}"
+DEFAULT_PYPROJECT_TOML = Template("""[project]
+name = "$name"
 version = "0.0.0"
 description = "Python monorepo"
 requires-python = ">=3.12"
 
 [tool.uv]
-workspace = {{ members = ["packages/*"] }}
+workspace = { members = ["packages/*"] }
 
 dev-dependencies = [
     "pytest>=8.0.0",
     "ruff>=0.8.0",
     "mypy>=1.10.0",
 ]
+""")
+
+DEFAULT_GITIGNORE = """# Python
+__pycache__/
+*.py[cod]
+*.so
+.venv/
+dist/
+build/
+*.egg-info/
+
+# Testing
+.pytest_cache/
+.coverage
+htmlcov/
+
+# Type checking
+.mypy_cache/
+
+# Linting
+.ruff_cache/
+
+# IDE
+.vscode/
+.idea/
+
+# OS
+.DS_Store
 """
 
 
@@ -86,12 +116,14 @@ def init_workspace(path: Path, name: str | None = None) -> None:
         ConfigurationError: If workspace already exists.
     """
     path = path.resolve()
+    path.mkdir(parents=True, exist_ok=True)
 
-    if not path.exists():
-        path.mkdir(parents=True)
+    # List the directory once instead of probing each file separately
+    with os.scandir(path) as entries:
+        existing = {entry.name for entry in entries}
 
     # Check if already initialized
-    if (path / "pymelos.yaml").exists():
+    if "pymelos.yaml" in existing:
         raise ConfigurationError("Workspace already initialized", path=path / "pymelos.yaml")
 
     # Use directory name as default
@@ -99,53 +131,20 @@ def init_workspace(path: Path, name: str | None = None) -> None:
         name = path.name
 
     # Create pymelos.yaml
-    pymelos_yaml = path / "pymelos.yaml"
-    pymelos_yaml.write_text(DEFAULT_PYMELOS_YAML.format(name=name), encoding="utf-8")
+    (path / "pymelos.yaml").write_bytes(DEFAULT_PYMELOS_YAML.substitute(name=name).encode())
 
     # Create pyproject.toml if it doesn't exist
-    pyproject = path / "pyproject.toml"
-    if not pyproject.exists():
-        pyproject.write_text(DEFAULT_PYPROJECT_TOML.format(name=name), encoding="utf-8")
+    if "pyproject.toml" not in existing:
+        (path / "pyproject.toml").write_bytes(DEFAULT_PYPROJECT_TOML.substitute(name=name).encode())
 
     # Create packages directory
-    packages_dir = path / "packages"
-    packages_dir.mkdir(exist_ok=True)
+    os.makedirs(path / "packages", exist_ok=True)
 
     # Create .gitignore if it doesn't exist
-    gitignore = path / ".gitignore"
-    if not gitignore.exists():
-        gitignore.write_text(
-            """# Python
-__pycache__/
-*.py[cod]
-*.so
-.venv/
-dist/
-build/
-*.egg-info/
-
-# Testing
-.pytest_cache/
-.coverage
-htmlcov/
-
-# Type checking
-.mypy_cache/
-
-# Linting
-.ruff_cache/
-
-# IDE
-.vscode/
-.idea/
-
-# OS
-.DS_Store
-""",
-            encoding="utf-8",
-        )
+    if ".gitignore" not in existing:
+        (path / ".gitignore").write_bytes(DEFAULT_GITIGNORE.encode())
 
     # Initialize git if not already a repo
-    if not (path / ".git").exists():
+    if ".git" not in existing:
         with contextlib.suppress(subprocess.CalledProcessError, FileNotFoundError):
             subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
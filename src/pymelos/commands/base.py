@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar
+from pathlib import Path
+from typing import Any, Generic, TypeVar
 
-from pymelos.workspace import Workspace
+from pymelos.git.changes import ref_cache_scope
+from pymelos.workspace import Package, Workspace
 
 TResult = TypeVar("TResult")
 
 
-@dataclass
+def relative_path(path: Path, root: Path) -> str:
+    """Return path relative to root as a string.
+
+    Package paths live under the workspace root, so this is usually a string
+    slice; it falls back to os.path.relpath for anything else.
+
+    Args:
+        path: Absolute path to convert.
+        root: Absolute workspace root.
+
+    Returns:
+        Relative path string ("." for the root itself).
+    """
+    path_str = str(path)
+    root_str = str(root)
+    if path_str.startswith(root_str) and path_str[len(root_str) : len(root_str) + 1] == os.sep:
+        return path_str[len(root_str) + 1 :]
+    return os.path.relpath(path_str, root_str)
+
+
+@dataclass(slots=True)
 class CommandContext:
     """Context passed to all commands.
 
@@ -27,13 +52,45 @@ class CommandContext:
     env: dict[str, str] = field(default_factory=dict)
 
 
+def _in_ref_cache_scope_async(
+    execute: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap an async execute() so git ref lookups are memoized only while it runs."""
+
+    @functools.wraps(execute)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with ref_cache_scope():
+            return await execute(*args, **kwargs)
+
+    return wrapper
+
+
+def _in_ref_cache_scope(execute: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap execute() so git ref lookups are memoized only while it runs."""
+
+    @functools.wraps(execute)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with ref_cache_scope():
+            return execute(*args, **kwargs)
+
+    return wrapper
+
+
 class Command(ABC, Generic[TResult]):
     """Base class for all pymelos commands.
 
     Commands encapsulate the logic for a specific operation.
-    They receive a context and return a result.
+    They receive a context and return a result. Each execute() runs inside
+    a git ref_cache_scope(), so repeated ref lookups share one git call
+    without their answers outliving the command.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if execute is not None and not getattr(execute, "__isabstractmethod__", False):
+            cls.execute = _in_ref_cache_scope_async(execute)  # type: ignore[method-assign]
+
     def __init__(self, context: CommandContext) -> None:
         """Initialize command.
 
@@ -42,6 +99,8 @@ class Command(ABC, Generic[TResult]):
         """
         self.context = context
         self.workspace = context.workspace
+        # Snapshot of workspace packages, materialized once per command
+        self.packages: list[Package] = list(context.workspace.packages.values())
 
     @abstractmethod
     async def execute(self) -> TResult:
@@ -62,7 +121,16 @@ class Command(ABC, Generic[TResult]):
 
 
 class SyncCommand(ABC, Generic[TResult]):
-    """Base class for synchronous commands."""
+    """Base class for synchronous commands.
+
+    Like Command, each execute() runs inside a git ref_cache_scope().
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if execute is not None and not getattr(execute, "__isabstractmethod__", False):
+            cls.execute = _in_ref_cache_scope(execute)  # type: ignore[method-assign]
 
     def __init__(self, context: CommandContext) -> None:
         """Initialize command.
@@ -72,6 +140,8 @@ class SyncCommand(ABC, Generic[TResult]):
         """
         self.context = context
         self.workspace = context.workspace
+        # Snapshot of workspace packages, materialized once per command
+        self.packages: list[Package] = list(context.workspace.packages.values())
 
     @abstractmethod
     def execute(self) -> TResult:
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import os
+from bisect import bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from pymelos.commands.base import CommandContext, SyncCommand
+from pymelos.commands.base import CommandContext, SyncCommand, relative_path
 from pymelos.workspace.workspace import Workspace
 
 if TYPE_CHECKING:
-    pass
+    from pymelos.workspace import Package
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedPackage:
     """Information about a changed package."""
 
@@ -22,7 +26,7 @@ class ChangedPackage:
     is_dependent: bool  # True if changed due to dependency
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedResult:
     """Result of changed command."""
 
@@ -31,7 +35,7 @@ class ChangedResult:
     total_files_changed: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedOptions:
     """Options for changed command."""
 
@@ -41,6 +45,52 @@ class ChangedOptions:
     ignore: list[str] | None = None
 
 
+def _map_files_to_packages(
+    root: Path,
+    packages: Iterable[Package],
+    files: Iterable[str],
+) -> dict[str, tuple[Package, list[str]]]:
+    """Group changed files by the package directories that contain them.
+
+    Package paths are kept in a sorted prefix index so each file is classified
+    with a single bisect instead of being checked against every package.
+
+    Args:
+        root: Workspace root the file paths are relative to.
+        packages: Packages to match against.
+        files: Changed file path strings relative to root.
+
+    Returns:
+        Dictionary mapping package name to the package and its changed files.
+    """
+    by_prefix = {str(pkg.path) + os.sep: pkg for pkg in packages}
+    prefixes = sorted(by_prefix)
+
+    # For nested packages, link each prefix to the closest enclosing one so a
+    # file is attributed to every package that contains it.
+    enclosing: list[int] = []
+    stack: list[int] = []
+    for i, prefix in enumerate(prefixes):
+        while stack and not prefix.startswith(prefixes[stack[-1]]):
+            stack.pop()
+        enclosing.append(stack[-1] if stack else -1)
+        stack.append(i)
+
+    root_prefix = str(root) + os.sep
+    result: dict[str, tuple[Package, list[str]]] = {}
+    for rel in files:
+        # git reports POSIX paths; match them against native package paths
+        abs_path = root_prefix + (rel if os.sep == "/" else rel.replace("/", os.sep))
+        i = bisect_right(prefixes, abs_path) - 1
+        while i >= 0:
+            if abs_path.startswith(prefixes[i]):
+                pkg = by_prefix[prefixes[i]]
+                result.setdefault(pkg.name, (pkg, []))[1].append(rel)
+            i = enclosing[i]
+
+    return result
+
+
 class ChangedCommand(SyncCommand[ChangedResult]):
     """List packages that have changed since a git reference."""
 
@@ -51,73 +101,45 @@ class ChangedCommand(SyncCommand[ChangedResult]):
     def execute(self) -> ChangedResult:
         """Execute the changed command."""
         from pymelos.filters import apply_filters
-        from pymelos.git import get_changed_files_since
+        from pymelos.git import get_changed_paths_since
 
         # Get all changed files
-        changed_files = get_changed_files_since(self.workspace.root, self.options.since)
-
-        # Map files to packages
-        directly_changed: dict[str, list[str]] = {}  # package -> files
-
-        for pkg in self.workspace.packages.values():
-            pkg_files: list[str] = []
-            for file_path in changed_files:
-                abs_path = self.workspace.root / file_path
-                try:
-                    abs_path.relative_to(pkg.path)
-                    pkg_files.append(str(file_path))
-                except ValueError:
-                    continue
-
-            if pkg_files:
-                directly_changed[pkg.name] = pkg_files
-
-        # Get dependents if requested
-        dependent_packages: set[str] = set()
-        if self.options.include_dependents:
-            for pkg_name in list(directly_changed.keys()):
-                dependents = self.workspace.graph.get_transitive_dependents(pkg_name)
-                for dep in dependents:
-                    if dep.name not in directly_changed:
-                        dependent_packages.add(dep.name)
-
-        # Build result
-        changed_pkgs: list[ChangedPackage] = []
-
-        # Add directly changed packages
-        for pkg_name, files in directly_changed.items():
-            pkg = self.workspace.get_package(pkg_name)
-            changed_pkgs.append(
-                ChangedPackage(
-                    name=pkg_name,
-                    path=str(pkg.path.relative_to(self.workspace.root)),
-                    files_changed=len(files),
-                    is_dependent=False,
-                )
-            )
+        changed_files = get_changed_paths_since(self.workspace.root, self.options.since)
+        if not changed_files:
+            return ChangedResult(since=self.options.since, changed=[], total_files_changed=0)
 
-        # Add dependent packages
-        for pkg_name in dependent_packages:
-            pkg = self.workspace.get_package(pkg_name)
-            changed_pkgs.append(
-                ChangedPackage(
-                    name=pkg_name,
-                    path=str(pkg.path.relative_to(self.workspace.root)),
-                    files_changed=0,
-                    is_dependent=True,
-                )
-            )
+        # Map files to packages (package name -> (package, files))
+        root = self.workspace.root
+        directly_changed = _map_files_to_packages(root, self.packages, changed_files)
+
+        # Package name -> (files changed, is dependent) for each reported package
+        entries = {name: (len(files), False) for name, (_, files) in directly_changed.items()}
+
+        # Add dependents if requested
+        if self.options.include_dependents and directly_changed:
+            dependents = self.workspace.graph.get_transitive_dependents_of(directly_changed)
+            entries.update((dep.name, (0, True)) for dep in dependents)
+
+        selected = [pkg for pkg in self.packages if pkg.name in entries]
 
         # Apply filters
         if self.options.scope or self.options.ignore:
-            pkg_list = [self.workspace.get_package(p.name) for p in changed_pkgs]
-            filtered = apply_filters(
-                pkg_list,
+            selected = apply_filters(
+                selected,
                 scope=self.options.scope,
                 ignore=self.options.ignore,
             )
-            filtered_names = {p.name for p in filtered}
-            changed_pkgs = [p for p in changed_pkgs if p.name in filtered_names]
+
+        # Build result, computing each relative path once
+        changed_pkgs = [
+            ChangedPackage(
+                name=pkg.name,
+                path=relative_path(pkg.path, root),
+                files_changed=entries[pkg.name][0],
+                is_dependent=entries[pkg.name][1],
+            )
+            for pkg in selected
+        ]
 
         # Sort by name
         changed_pkgs.sort(key=lambda p: p.name)
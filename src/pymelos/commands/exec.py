@@ -42,7 +42,7 @@ class ExecCommand(Command[BatchResult]):
         """Get packages to execute command in."""
         from pymelos.filters import apply_filters_with_since
 
-        packages = list(self.workspace.packages.values())
+        packages = self.packages
 
         return apply_filters_with_since(
             packages,
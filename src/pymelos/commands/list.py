@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from pymelos.commands.base import CommandContext, SyncCommand
+from pymelos.commands.base import CommandContext, SyncCommand, relative_path
 
 if TYPE_CHECKING:
     from pymelos.workspace import Package
@@ -22,7 +22,7 @@ class ListFormat(Enum):
     NAMES = "names"
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageInfo:
     """Information about a package for display."""
 
@@ -34,14 +34,14 @@ class PackageInfo:
     dependents: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ListResult:
     """Result of list command."""
 
     packages: list[PackageInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class ListOptions:
     """Options for list command."""
 
@@ -63,7 +63,7 @@ class ListCommand(SyncCommand[ListResult]):
         """Get packages to list."""
         from pymelos.filters import apply_filters_with_since
 
-        packages = list(self.workspace.packages.values())
+        packages = self.packages
 
         return apply_filters_with_since(
             packages,
@@ -76,9 +76,13 @@ class ListCommand(SyncCommand[ListResult]):
 
     def execute(self) -> ListResult:
         """Execute the list command."""
-        packages = self.get_packages()
+        packages = sorted(self.get_packages(), key=lambda p: p.name)
         graph = self.workspace.graph
 
+        # Relative paths, computed once per package
+        root = self.workspace.root
+        rel_paths = {pkg.name: relative_path(pkg.path, root) for pkg in packages}
+
         infos: list[PackageInfo] = []
         for pkg in packages:
             deps = graph.get_dependencies(pkg.name)
@@ -88,16 +92,13 @@ class ListCommand(SyncCommand[ListResult]):
                 PackageInfo(
                     name=pkg.name,
                     version=pkg.version,
-                    path=str(pkg.path.relative_to(self.workspace.root)),
+                    path=rel_paths[pkg.name],
                     description=pkg.description,
                     dependencies=[d.name for d in deps],
                     dependents=[d.name for d in dependents],
                 )
             )
 
-        # Sort by name
-        infos.sort(key=lambda p: p.name)
-
         return ListResult(packages=infos)
 
 
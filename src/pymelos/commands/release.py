@@ -8,20 +8,25 @@ from typing import TYPE_CHECKING
 from pymelos.commands.base import Command, CommandContext
 from pymelos.versioning import (
     BumpType,
+    ParsedCommit,
     Version,
     determine_bump,
     generate_changelog_entry,
+    may_bump_version,
     parse_commit,
     prepend_to_changelog,
     update_all_versions,
 )
 
 if TYPE_CHECKING:
+    from pymelos.git import Commit, Tag
     from pymelos.workspace import Package
     from pymelos.workspace.workspace import Workspace
 
+_DEFAULT_TAG_FORMAT = "{name}@{version}"
 
-@dataclass
+
+@dataclass(slots=True)
 class PackageRelease:
     """Information about a package release."""
 
@@ -35,7 +40,7 @@ class PackageRelease:
     published: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseResult:
     """Result of release command."""
 
@@ -45,7 +50,7 @@ class ReleaseResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseOptions:
     """Options for release command."""
 
@@ -75,6 +80,8 @@ class ReleaseCommand(Command[ReleaseResult]):
     def __init__(self, context: CommandContext, options: ReleaseOptions | None = None) -> None:
         super().__init__(context)
         self.options = options or ReleaseOptions()
+        self._parsed_commits: dict[str, ParsedCommit | None] = {}
+        self._tag_format = self.workspace.config.versioning.tag_format
 
     @property
     def is_dry_run(self) -> bool:
@@ -85,16 +92,54 @@ class ReleaseCommand(Command[ReleaseResult]):
         """Get packages that need release (scope-filtered only)."""
         from pymelos.filters import filter_by_scope
 
-        return filter_by_scope(list(self.workspace.packages.values()), self.options.scope)
+        return filter_by_scope(self.packages, self.options.scope)
+
+    def _get_release_history(
+        self, packages: list[Package]
+    ) -> dict[str, tuple[Tag | None, list[Commit]]]:
+        """Get each package's latest release tag and the commits since it."""
+        from pymelos.git import get_commits_for_paths, get_latest_package_tags
 
-    def _prepare_package_release(self, pkg: Package) -> PackageRelease | None:
-        """Prepare release info for a single package. Returns None if package should be skipped."""
-        from pymelos.git import get_commits, get_latest_package_tag
+        root = self.workspace.root
 
-        last_tag = get_latest_package_tag(self.workspace.root, pkg.name)
-        since_ref = last_tag.name if last_tag else None
+        # One tag listing covers every package
+        latest = get_latest_package_tags(root, [pkg.name for pkg in packages])
+        last_tags = [latest[pkg.name] for pkg in packages]
 
-        commits = get_commits(self.workspace.root, since=since_ref, path=pkg.path)
+        # Read history once for all packages instead of one git log per package
+        commits = get_commits_for_paths(
+            root,
+            {
+                pkg.name: (pkg.path, tag.name if tag else None)
+                for pkg, tag in zip(packages, last_tags, strict=True)
+            },
+        )
+
+        return {
+            pkg.name: (tag, commits[pkg.name]) for pkg, tag in zip(packages, last_tags, strict=True)
+        }
+
+    def _parse_commit(self, commit: Commit) -> ParsedCommit | None:
+        """Parse a commit, reusing the result for commits shared by packages."""
+        if commit.sha not in self._parsed_commits:
+            self._parsed_commits[commit.sha] = parse_commit(commit)
+        return self._parsed_commits[commit.sha]
+
+    def _prepare_package_release(
+        self,
+        pkg: Package,
+        history: tuple[Tag | None, list[Commit]] | None = None,
+    ) -> PackageRelease | None:
+        """Prepare release info for a single package. Returns None if package should be skipped.
+
+        Args:
+            pkg: Package to prepare.
+            history: Latest release tag and commits since it, as returned by
+                _get_release_history(). Looked up from git if not provided.
+        """
+        if history is None:
+            history = self._get_release_history([pkg])[pkg.name]
+        last_tag, commits = history
 
         # Skip unchanged packages
         if not commits:
@@ -104,32 +149,41 @@ class ReleaseCommand(Command[ReleaseResult]):
         if not last_tag and len(commits) <= 1 and not self.options.scope:
             return None
 
+        # Without an explicit bump, skip parsing when no commit can bump
+        if self.options.bump is None and not any(may_bump_version(c.message) for c in commits):
+            return None
+
         # Parse and filter conventional commits
-        parsed = [p for c in commits if (p := parse_commit(c)) is not None]
+        parsed = [p for c in commits if (p := self._parse_commit(c)) is not None]
 
-        if not parsed and not self.options.bump:
+        if not parsed and self.options.bump is None:
             return None
 
-        bump = self.options.bump or determine_bump(parsed)
+        bump = self.options.bump if self.options.bump is not None else determine_bump(parsed)
         if bump == BumpType.NONE:
             return None
 
         old_version = Version.parse(pkg.version)
-        new_version = old_version.bump(bump, self.options.prerelease)
-        tag_format = self.workspace.config.versioning.tag_format
+        new_version = str(old_version.bump(bump, self.options.prerelease))
 
-        changelog = generate_changelog_entry(str(new_version), parsed, package_name=pkg.name)
+        changelog = generate_changelog_entry(new_version, parsed, package_name=pkg.name)
 
         return PackageRelease(
             name=pkg.name,
             old_version=str(old_version),
-            new_version=str(new_version),
+            new_version=new_version,
             bump_type=bump,
             changelog_entry=changelog,
             commits=[c.sha[:7] for c in commits],
-            tag=tag_format.format(name=pkg.name, version=str(new_version)),
+            tag=self._format_tag(pkg.name, new_version),
         )
 
+    def _format_tag(self, name: str, version: str) -> str:
+        """Format a release tag name using the configured tag format."""
+        if self._tag_format == _DEFAULT_TAG_FORMAT:
+            return f"{name}@{version}"
+        return self._tag_format.format(name=name, version=version)
+
     def _apply_release_changes(self, release: PackageRelease) -> None:
         """Apply version and changelog changes for a release."""
         pkg = self.workspace.get_package(release.name)
@@ -140,7 +194,7 @@ class ReleaseCommand(Command[ReleaseResult]):
 
     def _create_git_commit(self, releases: list[PackageRelease]) -> str | None:
         """Create git commit for releases. Returns commit SHA."""
-        from pymelos.git import run_git_command
+        from pymelos.git import clear_ref_cache, run_git_command
 
         if self.options.no_commit:
             return None
@@ -151,22 +205,29 @@ class ReleaseCommand(Command[ReleaseResult]):
         commit_msg = self.workspace.config.versioning.commit_message.format(packages=pkg_versions)
 
         run_git_command(["commit", "-m", commit_msg], cwd=self.workspace.root)
+        clear_ref_cache()
         result = run_git_command(["rev-parse", "HEAD"], cwd=self.workspace.root)
         return result.stdout.strip()
 
-    def _create_git_tags(self, releases: list[PackageRelease]) -> None:
-        """Create git tags for releases."""
-        from pymelos.git import create_tag
+    def _create_git_tags(self, releases: list[PackageRelease], commit_sha: str | None) -> None:
+        """Create git tags for releases on commit_sha (HEAD if None)."""
+        from pymelos.git import TagSpec, create_tags
 
         if self.options.no_git_tag:
             return
 
-        for release in releases:
-            create_tag(
-                self.workspace.root,
-                release.tag,
-                message=f"Release {release.name}@{release.new_version}",
-            )
+        # Release tags are annotated, so create_tags runs git tag -a for each one
+        create_tags(
+            self.workspace.root,
+            [
+                TagSpec(
+                    name=release.tag,
+                    message=f"Release {release.name}@{release.new_version}",
+                    commit=commit_sha,
+                )
+                for release in releases
+            ],
+        )
 
     def _publish_releases(self, releases: list[PackageRelease]) -> str | None:
         """Publish releases to PyPI. Returns error message on failure."""
@@ -191,7 +252,12 @@ class ReleaseCommand(Command[ReleaseResult]):
             return ReleaseResult(releases=[], success=True)
 
         # Prepare releases (filter out packages that shouldn't be released)
-        releases = [r for pkg in packages if (r := self._prepare_package_release(pkg)) is not None]
+        history = self._get_release_history(packages)
+        releases = [
+            r
+            for pkg in packages
+            if (r := self._prepare_package_release(pkg, history[pkg.name])) is not None
+        ]
 
         if not releases:
             return ReleaseResult(releases=[], success=True)
@@ -202,7 +268,7 @@ class ReleaseCommand(Command[ReleaseResult]):
                 self._apply_release_changes(release)
 
             commit_sha = self._create_git_commit(releases)
-            self._create_git_tags(releases)
+            self._create_git_tags(releases, commit_sha)
 
             if error := self._publish_releases(releases):
                 return ReleaseResult(
@@ -56,7 +56,7 @@ class RunCommand(Command[BatchResult]):
         """Get packages to run script in."""
         from pymelos.filters import apply_filters_with_since
 
-        packages = list(self.workspace.packages.values())
+        packages = self.packages
 
         # Get script-specific scope if defined
         script = self.workspace.config.get_script(self.options.script_name)
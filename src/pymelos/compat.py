@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import sys
+from types import ModuleType
+from typing import IO, Any
 
 # tomllib is only available in Python 3.11+
 # Use tomli for Python 3.10
@@ -11,4 +13,34 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib  # type: ignore[import-not-found]
 
+
+class _RtomlAdapter:
+    """Expose rtoml through the subset of the tomllib API pymelos uses.
+
+    Attributes:
+        TOMLDecodeError: rtoml's parse error, so ``except tomllib.TOMLDecodeError``
+            keeps working.
+    """
+
+    def __init__(self, rtoml: ModuleType) -> None:
+        self._rtoml = rtoml
+        self.TOMLDecodeError: type[ValueError] = rtoml.TomlParsingError
+
+    def load(self, fp: IO[bytes]) -> dict[str, Any]:
+        """Parse TOML from a binary file object, like tomllib.load."""
+        return self._rtoml.loads(fp.read().decode())
+
+    def loads(self, s: str) -> dict[str, Any]:
+        """Parse TOML from a string, like tomllib.loads."""
+        return self._rtoml.loads(s)
+
+
+# Prefer the native rtoml parser when installed (the "fast" extra)
+try:
+    import rtoml as _rtoml  # type: ignore[import-not-found]
+except ImportError:
+    pass
+else:
+    tomllib = _RtomlAdapter(_rtoml)  # type: ignore[assignment]
+
 __all__ = ["tomllib"]
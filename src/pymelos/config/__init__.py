@@ -1,27 +1,33 @@
 """Configuration loading and validation."""
 
-from pymelos.config.loader import (
-    CONFIG_FILENAME,
-    find_config_file,
-    get_workspace_root,
-    load_config,
-    load_yaml,
-)
-from pymelos.config.schema import (
-    BootstrapConfig,
-    BootstrapHook,
-    ChangelogConfig,
-    ChangelogSection,
-    CleanConfig,
-    CommandDefaults,
-    CommitFormat,
-    IDEConfig,
-    PublishConfig,
-    PyMelosConfig,
-    ScriptConfig,
-    VersioningConfig,
-    VSCodeConfig,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pymelos.config.loader import (
+        CONFIG_FILENAME,
+        find_config_file,
+        get_workspace_root,
+        load_config,
+        load_yaml,
+    )
+    from pymelos.config.schema import (
+        BootstrapConfig,
+        BootstrapHook,
+        ChangelogConfig,
+        ChangelogSection,
+        CleanConfig,
+        CommandDefaults,
+        CommitFormat,
+        IDEConfig,
+        PublishConfig,
+        PyMelosConfig,
+        ScriptConfig,
+        VersioningConfig,
+        VSCodeConfig,
+    )
 
 __all__ = [
     # Loader
@@ -45,3 +51,19 @@ __all__ = [
     "VersioningConfig",
     "VSCodeConfig",
 ]
+
+# Both submodules pull in pydantic; import them on first attribute access
+_LOADER_NAMES = frozenset(__all__[:5])
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = "pymelos.config.loader" if name in _LOADER_NAMES else "pymelos.config.schema"
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
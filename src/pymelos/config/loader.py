@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
 from pathlib import Path
 from typing import Any
 
@@ -11,9 +14,21 @@ from pydantic import ValidationError as PydanticValidationError
 from pymelos.config.schema import PyMelosConfig
 from pymelos.errors import ConfigurationError, WorkspaceNotFoundError
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 CONFIG_FILENAME = "pymelos.yaml"
 ALT_CONFIG_FILENAME = "pymelos.yml"
-CONFIG_FILENAMES = (CONFIG_FILENAME, ALT_CONFIG_FILENAME)
+CONFIG_FILENAMES = frozenset({CONFIG_FILENAME, ALT_CONFIG_FILENAME})
+# Lookup order when a directory contains both files
+_CONFIG_FILENAME_PRECEDENCE = (CONFIG_FILENAME, ALT_CONFIG_FILENAME)
+
+# Parsed configs keyed by resolved path, with the (mtime_ns, size, content digest)
+# of the file they were read from
+_CONFIG_CACHE: dict[Path, tuple[int, int, bytes, PyMelosConfig]] = {}
 
 
 def find_config_file(start_path: Path | None = None) -> Path:
@@ -34,11 +49,16 @@ def find_config_file(start_path: Path | None = None) -> Path:
 
     current = start_path
     while True:
-        # Check for both .yaml and .yml extensions
-        for filename in CONFIG_FILENAMES:
-            config_path = current / filename
-            if config_path.is_file():
-                return config_path
+        # List the directory once and look for both .yaml and .yml extensions
+        found: set[str] = set()
+        with contextlib.suppress(OSError), os.scandir(current) as entries:
+            for entry in entries:
+                if entry.name in CONFIG_FILENAMES and entry.is_file():
+                    found.add(entry.name)
+
+        for filename in _CONFIG_FILENAME_PRECEDENCE:
+            if filename in found:
+                return current / filename
 
         # Move to parent directory
         parent = current.parent
@@ -61,20 +81,26 @@ def load_yaml(path: Path) -> dict[str, Any]:
         ConfigurationError: If the file cannot be read or parsed.
     """
     try:
-        with open(path, encoding="utf-8") as f:
-            content = yaml.safe_load(f)
-            if content is None:
-                return {}
-            if not isinstance(content, dict):
-                raise ConfigurationError(
-                    "Configuration must be a YAML mapping (dictionary)",
-                    path=path,
-                )
-            return content
-    except yaml.YAMLError as e:
-        raise ConfigurationError(f"Invalid YAML syntax: {e}", path=path) from e
+        data = path.read_bytes()
     except OSError as e:
         raise ConfigurationError(f"Cannot read file: {e}", path=path) from e
+    return _parse_yaml(data, path)
+
+
+def _parse_yaml(data: bytes, path: Path) -> dict[str, Any]:
+    """Parse YAML content read from path into a dictionary."""
+    try:
+        content = yaml.load(data, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ConfigurationError(f"Invalid YAML syntax: {e}", path=path) from e
+    if content is None:
+        return {}
+    if not isinstance(content, dict):
+        raise ConfigurationError(
+            "Configuration must be a YAML mapping (dictionary)",
+            path=path,
+        )
+    return content
 
 
 def load_config(
@@ -102,10 +128,30 @@ def load_config(
         if not path.is_file():
             raise ConfigurationError(f"Config file not found: {path}")
 
-    raw_config = load_yaml(path)
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise ConfigurationError(f"Cannot read file: {e}", path=path) from e
+
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[3], path
+
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise ConfigurationError(f"Cannot read file: {e}", path=path) from e
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+
+    # Touched or re-checked out without a content change: keep the parsed config
+    if cached is not None and cached[1] == stat.st_size and cached[2] == digest:
+        _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, digest, cached[3])
+        return cached[3], path
+
+    raw_config = _parse_yaml(data, path)
 
     try:
-        config = PyMelosConfig(**raw_config)
+        config = PyMelosConfig.fast_reload(raw_config, digest.hex())
     except PydanticValidationError as e:
         errors = []
         for error in e.errors():
@@ -117,6 +163,7 @@ def load_config(
             path=path,
         ) from e
 
+    _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, digest, config)
     return config, path
 
 
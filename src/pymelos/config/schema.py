@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cached_property
 from typing import Annotated, Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -18,6 +19,8 @@ class CommitFormat(str, Enum):
 class ScriptConfig(BaseModel):
     """Configuration for a script command."""
 
+    model_config = {"frozen": True}
+
     run: str = Field(..., description="Command to execute")
     description: str | None = Field(default=None, description="Human-readable description")
     env: dict[str, str] = Field(default_factory=dict, description="Environment variables")
@@ -31,6 +34,8 @@ class ScriptConfig(BaseModel):
 class BootstrapHook(BaseModel):
     """Configuration for a bootstrap hook."""
 
+    model_config = {"frozen": True}
+
     name: str = Field(..., description="Hook name for display")
     run: str = Field(..., description="Command to execute")
     scope: str | None = Field(default=None, description="Package scope filter")
@@ -40,12 +45,16 @@ class BootstrapHook(BaseModel):
 class BootstrapConfig(BaseModel):
     """Bootstrap command configuration."""
 
+    model_config = {"frozen": True}
+
     hooks: list[BootstrapHook] = Field(default_factory=list, description="Post-sync hooks")
 
 
 class CleanConfig(BaseModel):
     """Clean command configuration."""
 
+    model_config = {"frozen": True}
+
     patterns: list[str] = Field(
         default_factory=lambda: [
             "__pycache__",
@@ -71,6 +80,8 @@ class CleanConfig(BaseModel):
 class ChangelogSection(BaseModel):
     """Changelog section configuration."""
 
+    model_config = {"frozen": True}
+
     type: str = Field(..., description="Commit type (feat, fix, etc.)")
     title: str = Field(..., description="Section title in changelog")
     hidden: bool = Field(default=False, description="Hide from changelog")
@@ -79,6 +90,8 @@ class ChangelogSection(BaseModel):
 class ChangelogConfig(BaseModel):
     """Changelog generation configuration."""
 
+    model_config = {"frozen": True}
+
     enabled: bool = Field(default=True, description="Generate changelogs")
     filename: str = Field(default="CHANGELOG.md", description="Changelog filename")
     sections: list[ChangelogSection] = Field(
@@ -96,6 +109,8 @@ class ChangelogConfig(BaseModel):
 class VersioningConfig(BaseModel):
     """Version/release configuration."""
 
+    model_config = {"frozen": True}
+
     commit_format: CommitFormat = Field(
         default=CommitFormat.CONVENTIONAL,
         description="Commit message format",
@@ -121,6 +136,8 @@ class VersioningConfig(BaseModel):
 class PublishConfig(BaseModel):
     """Publishing configuration."""
 
+    model_config = {"frozen": True}
+
     registry: str = Field(
         default="https://upload.pypi.org/legacy/",
         description="PyPI registry URL",
@@ -134,6 +151,8 @@ class PublishConfig(BaseModel):
 class CommandDefaults(BaseModel):
     """Default settings for commands."""
 
+    model_config = {"frozen": True}
+
     concurrency: Annotated[int, Field(ge=1, le=32)] = Field(
         default=4,
         description="Default parallel jobs",
@@ -145,25 +164,29 @@ class CommandDefaults(BaseModel):
 class VSCodeConfig(BaseModel):
     """VS Code specific settings."""
 
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "frozen": True}
 
 
 class IDEConfig(BaseModel):
     """IDE integration configuration."""
 
+    model_config = {"frozen": True}
+
     vscode: VSCodeConfig = Field(default_factory=VSCodeConfig)
 
 
 class PyMelosConfig(BaseModel):
     """Root configuration model for pymelos.yaml."""
 
+    model_config = {"frozen": True}
+
     name: str = Field(..., description="Workspace name")
     packages: list[str] = Field(..., description="Package glob patterns (e.g., ['packages/*'])")
     ignore: list[str] = Field(
         default_factory=list,
         description="Patterns to exclude from package discovery",
     )
-    scripts: dict[str, ScriptConfig | str | dict[str, Any]] = Field(
+    scripts: dict[str, ScriptConfig] = Field(
         default_factory=dict,
         description="Scripts that can be run with 'pymelos run <name>'",
     )
@@ -196,6 +219,34 @@ class PyMelosConfig(BaseModel):
         description="Environment variables for all commands",
     )
 
+    @classmethod
+    def fast_reload(cls, data: dict[str, Any], hash_key: str) -> PyMelosConfig:
+        """Validate config data, reusing the result for previously seen content.
+
+        Intended for reload loops (file watchers, long-running processes)
+        where the same content is validated repeatedly. The caller supplies a
+        hash of the source content; configs are immutable, so a cached
+        instance can be shared safely.
+
+        Args:
+            data: Raw configuration mapping.
+            hash_key: Hash of the content data was parsed from.
+
+        Returns:
+            Validated configuration.
+
+        Raises:
+            pydantic.ValidationError: If data is invalid.
+        """
+        config = _FAST_RELOAD_CACHE.get(hash_key)
+        if config is None:
+            config = cls.model_validate(data)
+            if len(_FAST_RELOAD_CACHE) >= _FAST_RELOAD_CACHE_SIZE:
+                # Drop the oldest entry
+                del _FAST_RELOAD_CACHE[next(iter(_FAST_RELOAD_CACHE))]
+            _FAST_RELOAD_CACHE[hash_key] = config
+        return config
+
     @field_validator("scripts", mode="before")
     @classmethod
     def normalize_scripts(cls, v: dict[str, Any]) -> dict[str, ScriptConfig]:
@@ -221,16 +272,14 @@ class PyMelosConfig(BaseModel):
 
     def get_script(self, name: str) -> ScriptConfig | None:
         """Get a script configuration by name."""
-        script = self.scripts.get(name)
-        if script is None:
-            return None
-        if isinstance(script, str):
-            return ScriptConfig(run=script)
-        if isinstance(script, dict):
-            return ScriptConfig(**script)
-        return script
-
-    @property
-    def script_names(self) -> list[str]:
+        return self.scripts.get(name)
+
+    @cached_property
+    def script_names(self) -> tuple[str, ...]:
         """Get all defined script names."""
-        return list(self.scripts.keys())
+        return tuple(self.scripts)
+
+
+# Validated configs by content hash, for PyMelosConfig.fast_reload()
+_FAST_RELOAD_CACHE: dict[str, PyMelosConfig] = {}
+_FAST_RELOAD_CACHE_SIZE = 16
@@ -6,15 +6,27 @@ errors with a single except clause.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import cached_property
 from pathlib import Path
 
 
 class PyMelosError(Exception):
-    """Base exception for all pymelos errors."""
+    """Base exception for all pymelos errors.
 
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(message)
+    Subclasses whose message is costly to build may pass no message and
+    define ``message`` as a cached property, so it is only formatted when
+    the error is actually displayed.
+    """
+
+    def __init__(self, message: str | None = None, *args: object) -> None:
+        if message is not None:
+            self.message = message
+            args = (message, *args)
+        super().__init__(*args)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ConfigurationError(PyMelosError):
@@ -41,13 +53,18 @@ class WorkspaceNotFoundError(PyMelosError):
 class PackageNotFoundError(PyMelosError):
     """Requested package does not exist in workspace."""
 
-    def __init__(self, name: str, available: list[str] | None = None) -> None:
+    def __init__(self, name: str, available: Sequence[str] | None = None) -> None:
         self.name = name
-        self.available = available or []
-        message = f"Package '{name}' not found in workspace."
+        self.available = list(available or ())
+        super().__init__(None, name)
+
+    @cached_property
+    def message(self) -> str:
+        """Error message, listing available packages."""
+        message = f"Package '{self.name}' not found in workspace."
         if self.available:
             message += f" Available packages: {', '.join(sorted(self.available))}"
-        super().__init__(message)
+        return message
 
 
 class CyclicDependencyError(PyMelosError):
@@ -55,20 +72,30 @@ class CyclicDependencyError(PyMelosError):
 
     def __init__(self, cycle: list[str]) -> None:
         self.cycle = cycle
-        cycle_str = " -> ".join(cycle + [cycle[0]])
-        super().__init__(f"Cyclic dependency detected: {cycle_str}")
+        super().__init__(None, cycle)
+
+    @cached_property
+    def message(self) -> str:
+        """Error message showing the cycle."""
+        cycle_str = " -> ".join([*self.cycle, self.cycle[0]])
+        return f"Cyclic dependency detected: {cycle_str}"
 
 
 class ScriptNotFoundError(PyMelosError):
     """Requested script is not defined in pymelos.yaml."""
 
-    def __init__(self, name: str, available: list[str] | None = None) -> None:
+    def __init__(self, name: str, available: Sequence[str] | None = None) -> None:
         self.name = name
-        self.available = available or []
-        message = f"Script '{name}' not defined in pymelos.yaml."
+        self.available = list(available or ())
+        super().__init__(None, name)
+
+    @cached_property
+    def message(self) -> str:
+        """Error message, listing available scripts."""
+        message = f"Script '{self.name}' not defined in pymelos.yaml."
         if self.available:
             message += f" Available scripts: {', '.join(sorted(self.available))}"
-        super().__init__(message)
+        return message
 
 
 class ExecutionError(PyMelosError):
@@ -135,5 +162,9 @@ class ValidationError(PyMelosError):
 
     def __init__(self, errors: list[str]) -> None:
         self.errors = errors
-        message = "Validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
-        super().__init__(message)
+        super().__init__(None, errors)
+
+    @cached_property
+    def message(self) -> str:
+        """Error message listing every issue."""
+        return "Validation failed:\n" + "\n".join(f"  - {e}" for e in self.errors)
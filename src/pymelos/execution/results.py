@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -42,17 +43,17 @@ class ExecutionResult:
     @property
     def success(self) -> bool:
         """Check if execution was successful."""
-        return self.status == ExecutionStatus.SUCCESS
+        return self.status is ExecutionStatus.SUCCESS
 
     @property
     def failed(self) -> bool:
         """Check if execution failed."""
-        return self.status == ExecutionStatus.FAILURE
+        return self.status is ExecutionStatus.FAILURE
 
     @property
     def skipped(self) -> bool:
         """Check if execution was skipped."""
-        return self.status == ExecutionStatus.SKIPPED
+        return self.status is ExecutionStatus.SKIPPED
 
     @classmethod
     def success_result(
@@ -112,10 +113,14 @@ class ExecutionResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of executing a command across multiple packages.
 
+    Aggregates are tallied as results are added, so summary properties don't
+    rescan the results list. Iterate ``results`` directly in hot loops; the
+    sequence dunders are kept for convenience.
+
     Attributes:
         results: Individual execution results.
         total_duration_ms: Total execution duration.
@@ -123,50 +128,68 @@ class BatchResult:
 
     results: list[ExecutionResult] = field(default_factory=list)
     total_duration_ms: int = 0
+    _successful: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _failed: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _skipped_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for result in self.results:
+            self._tally(result)
+
+    def _tally(self, result: ExecutionResult) -> None:
+        """Update the aggregates for one result."""
+        status = result.status
+        if status is ExecutionStatus.SUCCESS:
+            self._successful.append(result.package_name)
+        elif status is ExecutionStatus.FAILURE:
+            self._failed.append(result.package_name)
+        elif status is ExecutionStatus.SKIPPED:
+            self._skipped_count += 1
 
     @property
     def all_success(self) -> bool:
         """Check if all executions were successful."""
-        return all(r.success or r.skipped for r in self.results)
+        return len(self._successful) + self._skipped_count == len(self.results)
 
     @property
     def any_failure(self) -> bool:
         """Check if any execution failed."""
-        return any(r.failed for r in self.results)
+        return bool(self._failed)
 
     @property
     def success_count(self) -> int:
         """Count of successful executions."""
-        return sum(1 for r in self.results if r.success)
+        return len(self._successful)
 
     @property
     def failure_count(self) -> int:
         """Count of failed executions."""
-        return sum(1 for r in self.results if r.failed)
+        return len(self._failed)
 
     @property
     def skipped_count(self) -> int:
         """Count of skipped executions."""
-        return sum(1 for r in self.results if r.skipped)
+        return self._skipped_count
 
     @property
     def failed_packages(self) -> list[str]:
         """Get names of packages that failed."""
-        return [r.package_name for r in self.results if r.failed]
+        return list(self._failed)
 
     @property
     def successful_packages(self) -> list[str]:
         """Get names of packages that succeeded."""
-        return [r.package_name for r in self.results if r.success]
+        return list(self._successful)
 
     def add(self, result: ExecutionResult) -> None:
         """Add a result to the batch."""
         self.results.append(result)
+        self._tally(result)
 
     def __len__(self) -> int:
         """Number of results."""
         return len(self.results)
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[ExecutionResult]:
         """Iterate over results."""
         return iter(self.results)
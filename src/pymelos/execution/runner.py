@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import sys
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -102,6 +103,9 @@ async def run_in_package(
         timeout=timeout,
     )
 
+    # Every package in a batch usually runs the same command; share one copy
+    command = sys.intern(command)
+
     if exit_code == 0:
         return ExecutionResult.success_result(
             package_name=package.name,
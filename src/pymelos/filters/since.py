@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -47,22 +48,22 @@ def get_changed_packages(
     Returns:
         List of changed packages.
     """
-    changed_files = get_changed_files(workspace.root, since)
+    from pymelos.git import get_changed_paths_since
 
-    # Map changed files to packages
-    changed_packages: list[Package] = []
+    changed_files = get_changed_paths_since(workspace.root, since)
+
+    # Map changed files to packages, building each absolute path only once
+    root_prefix = str(workspace.root) + os.sep
+    abs_changed = [root_prefix + changed_file for changed_file in changed_files]
+    if os.sep != "/":
+        abs_changed = [path.replace("/", os.sep) for path in abs_changed]
 
+    changed_packages: list[Package] = []
     for package in workspace.packages.values():
         # Check if any changed file is within this package
-        for changed_file in changed_files:
-            abs_changed = workspace.root / changed_file
-            try:
-                abs_changed.relative_to(package.path)
-                if package not in changed_packages:
-                    changed_packages.append(package)
-                break
-            except ValueError:
-                continue
+        pkg_prefix = str(package.path) + os.sep
+        if any(path.startswith(pkg_prefix) for path in abs_changed):
+            changed_packages.append(package)
 
     if include_dependents:
         affected = workspace.get_affected_packages(changed_packages)
@@ -1,69 +1,99 @@
 """Git operations."""
 
 from pymelos.git.changes import (
+    clear_ref_cache,
     get_changed_files_since,
+    get_changed_paths_since,
     get_commits_since,
     get_files_in_commit,
     get_merge_base,
     is_ancestor,
+    ref_cache_scope,
 )
 from pymelos.git.commits import (
     Commit,
     get_commit,
     get_commits,
     get_commits_affecting_path,
+    get_commits_for_paths,
 )
 from pymelos.git.repo import (
+    GitBatchSession,
+    RepoSnapshot,
+    get_batch_session,
     get_current_branch,
     get_current_commit,
     get_default_branch,
     get_repo_root,
+    get_repo_snapshot,
+    get_repo_snapshot_async,
     is_clean,
     is_git_repo,
     run_git_command,
     run_git_command_async,
+    run_git_command_quiet,
+    run_git_command_stream,
 )
 from pymelos.git.tags import (
     Tag,
+    TagSpec,
     create_tag,
+    create_tags,
     delete_tag,
     get_latest_package_tag,
+    get_latest_package_tags,
     get_latest_tag,
     get_package_tags,
     get_tags_for_commit,
+    list_all_tags_grouped,
     list_tags,
     parse_version_from_tag,
 )
 
 __all__ = [
     # Repo
+    "GitBatchSession",
+    "get_batch_session",
     "is_git_repo",
     "get_repo_root",
     "run_git_command",
     "run_git_command_async",
+    "run_git_command_quiet",
+    "run_git_command_stream",
     "get_current_branch",
     "get_current_commit",
     "is_clean",
     "get_default_branch",
+    "RepoSnapshot",
+    "get_repo_snapshot",
+    "get_repo_snapshot_async",
     # Changes
     "get_changed_files_since",
+    "get_changed_paths_since",
     "get_files_in_commit",
     "get_commits_since",
     "is_ancestor",
     "get_merge_base",
+    "clear_ref_cache",
+    "ref_cache_scope",
     # Commits
     "Commit",
     "get_commits",
     "get_commit",
     "get_commits_affecting_path",
+    "get_commits_for_paths",
     # Tags
     "Tag",
+    "TagSpec",
     "list_tags",
+    "list_all_tags_grouped",
     "get_latest_tag",
     "get_tags_for_commit",
     "create_tag",
+    "create_tags",
     "delete_tag",
     "parse_version_from_tag",
     "get_package_tags",
     "get_latest_package_tag",
+    "get_latest_package_tags",
 ]
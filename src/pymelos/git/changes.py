@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import TypeVar, cast
 
-from pymelos.git.repo import run_git_command
+from pymelos.git.repo import run_git_command, run_git_command_quiet
 
+_T = TypeVar("_T")
 
-def get_changed_files_since(
+# Spellings of HEAD itself; HEAD..HEAD is always empty
+_HEAD_REFS = frozenset({"HEAD", "@"})
+
+# Memoized ref lookups of the active ref_cache_scope(), if any
+_ref_cache: ContextVar[dict[tuple[str, ...], object] | None] = ContextVar(
+    "pymelos_git_ref_cache", default=None
+)
+
+
+def get_changed_paths_since(
     cwd: Path,
     since: str,
     *,
     include_untracked: bool = True,
-) -> set[Path]:
-    """Get files changed since a git reference.
+) -> set[str]:
+    """Get files changed since a git reference, as path strings.
+
+    Same as get_changed_files_since() but skips building a Path per file,
+    for callers that only match path prefixes.
 
     Args:
         cwd: Working directory (repository root).
@@ -21,56 +39,64 @@ def get_changed_files_since(
         include_untracked: Include untracked files.
 
     Returns:
-        Set of changed file paths (relative to cwd).
+        Set of changed file paths (POSIX strings relative to cwd).
     """
-    changed: set[Path] = set()
+    untracked = "--untracked-files=all" if include_untracked else "--untracked-files=no"
+    queries = [
+        # Files changed between since ref and HEAD
+        ["diff", "-z", "--name-only", f"{since}...HEAD"],
+        # Staged, unstaged and (optionally) untracked changes in one pass
+        ["status", "--porcelain=v1", "-z", untracked],
+    ]
+
+    # The queries are independent git subprocesses; run them concurrently
+    # instead of paying each one's startup latency in turn.
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        diff, status = pool.map(lambda args: run_git_command(args, cwd=cwd, check=False), queries)
+
+    # -z output is NUL-terminated and never quoted, so unusual file names
+    # come through verbatim
+    changed: set[str] = set()
+    if diff.returncode == 0:
+        changed.update(diff.stdout.split("\0"))
+    if status.returncode == 0:
+        changed.update(_parse_status_paths(status.stdout))
+    changed.discard("")
 
-    # Get files changed between since ref and HEAD
-    result = run_git_command(
-        ["diff", "--name-only", f"{since}...HEAD"],
-        cwd=cwd,
-        check=False,
-    )
-    if result.returncode == 0:
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                changed.add(Path(line))
+    return changed
 
-    # Get staged changes
-    result = run_git_command(
-        ["diff", "--name-only", "--cached"],
-        cwd=cwd,
-        check=False,
-    )
-    if result.returncode == 0:
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                changed.add(Path(line))
 
-    # Get unstaged changes
-    result = run_git_command(
-        ["diff", "--name-only"],
-        cwd=cwd,
-        check=False,
-    )
-    if result.returncode == 0:
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                changed.add(Path(line))
-
-    # Get untracked files
-    if include_untracked:
-        result = run_git_command(
-            ["ls-files", "--others", "--exclude-standard"],
-            cwd=cwd,
-            check=False,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    changed.add(Path(line))
+def _parse_status_paths(output: str) -> list[str]:
+    """Extract paths from `git status --porcelain=v1 -z` output."""
+    paths: list[str] = []
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        paths.append(entry[3:])
+        # Renames and copies are followed by their source path
+        if entry[0] in "RC" or entry[1] in "RC":
+            next(entries, None)
+    return paths
 
-    return changed
+
+def get_changed_files_since(
+    cwd: Path,
+    since: str,
+    *,
+    include_untracked: bool = True,
+) -> set[Path]:
+    """Get files changed since a git reference.
+
+    Args:
+        cwd: Working directory (repository root).
+        since: Git reference (branch, tag, commit SHA).
+        include_untracked: Include untracked files.
+
+    Returns:
+        Set of changed file paths (relative to cwd).
+    """
+    return set(map(Path, get_changed_paths_since(cwd, since, include_untracked=include_untracked)))
 
 
 def get_files_in_commit(cwd: Path, commit: str) -> set[Path]:
@@ -84,14 +110,10 @@ def get_files_in_commit(cwd: Path, commit: str) -> set[Path]:
         Set of file paths changed in the commit.
     """
     result = run_git_command(
-        ["diff-tree", "--no-commit-id", "--name-only", "-r", commit],
+        ["diff-tree", "-z", "--no-commit-id", "--name-only", "-r", commit],
         cwd=cwd,
     )
-    files: set[Path] = set()
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            files.add(Path(line))
-    return files
+    return set(map(Path, filter(None, result.stdout.split("\0"))))
 
 
 def get_commits_since(
@@ -110,6 +132,15 @@ def get_commits_since(
     Returns:
         List of commit SHAs (newest first).
     """
+    if since in _HEAD_REFS:
+        return []
+    # A since that names the HEAD commit (e.g. the branch or a tag on it)
+    # gives an empty range too; one rev-parse is still cheaper than git log
+    resolved = run_git_command(["rev-parse", f"{since}^{{commit}}", "HEAD"], cwd=cwd)
+    since_sha, head_sha = resolved.stdout.split()
+    if since_sha == head_sha:
+        return []
+
     args = ["log", "--format=%H", f"{since}..HEAD"]
     if path:
         args.extend(["--", str(path)])
@@ -119,9 +150,43 @@ def get_commits_since(
     return commits
 
 
+@contextmanager
+def ref_cache_scope() -> Iterator[None]:
+    """Memoize is_ancestor() and get_merge_base() results within a block.
+
+    Outside a scope every call asks git. Commands run inside a scope for the
+    duration of execute(), so repeated lookups with the same refs share one
+    git call without answers outliving the command. Nested scopes share the
+    outermost cache.
+
+    Yields:
+        None; the cache is dropped when the block exits.
+    """
+    if _ref_cache.get() is not None:
+        yield
+        return
+    token = _ref_cache.set({})
+    try:
+        yield
+    finally:
+        _ref_cache.reset(token)
+
+
+def _memoize(key: tuple[str, ...], compute: Callable[[], _T]) -> _T:
+    """Look up key in the active ref cache, computing it on a miss."""
+    cache = _ref_cache.get()
+    if cache is None:
+        return compute()
+    if key not in cache:
+        cache[key] = compute()
+    return cast(_T, cache[key])
+
+
 def is_ancestor(cwd: Path, commit: str, ancestor: str) -> bool:
     """Check if ancestor is an ancestor of commit.
 
+    Results are cached within a ref_cache_scope(); see clear_ref_cache().
+
     Args:
         cwd: Working directory.
         commit: Commit to check.
@@ -130,17 +195,18 @@ def is_ancestor(cwd: Path, commit: str, ancestor: str) -> bool:
     Returns:
         True if ancestor is an ancestor of commit.
     """
-    result = run_git_command(
-        ["merge-base", "--is-ancestor", ancestor, commit],
-        cwd=cwd,
-        check=False,
-    )
-    return result.returncode == 0
+
+    def check() -> bool:
+        return run_git_command_quiet(["merge-base", "--is-ancestor", ancestor, commit], cwd) == 0
+
+    return _memoize(("is_ancestor", str(cwd.resolve()), commit, ancestor), check)
 
 
 def get_merge_base(cwd: Path, ref1: str, ref2: str) -> str:
     """Get the merge base between two refs.
 
+    Results are cached within a ref_cache_scope(); see clear_ref_cache().
+
     Args:
         cwd: Working directory.
         ref1: First reference.
@@ -149,5 +215,20 @@ def get_merge_base(cwd: Path, ref1: str, ref2: str) -> str:
     Returns:
         Merge base commit SHA.
     """
-    result = run_git_command(["merge-base", ref1, ref2], cwd=cwd)
-    return result.stdout.strip()
+
+    def merge_base() -> str:
+        return run_git_command(["merge-base", ref1, ref2], cwd=cwd).stdout.strip()
+
+    return _memoize(("merge_base", str(cwd.resolve()), ref1, ref2), merge_base)
+
+
+def clear_ref_cache() -> None:
+    """Forget cached is_ancestor() and get_merge_base() results.
+
+    Call this after moving refs (committing, tagging, resetting) inside a
+    ref_cache_scope() so symbolic refs such as HEAD are resolved again.
+    pymelos's own tag and release operations clear the cache themselves.
+    """
+    cache = _ref_cache.get()
+    if cache is not None:
+        cache.clear()
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from pymelos.git.repo import run_git_command
+from pymelos.git.repo import get_batch_session, run_git_command, run_git_command_stream
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,7 +17,8 @@ class Commit:
 
     Attributes:
         sha: Full commit SHA.
-        short_sha: Abbreviated commit SHA.
+        short_sha: Abbreviated commit SHA (the first seven hex digits; not
+            disambiguated against the object database).
         message: Full commit message.
         subject: First line of commit message.
         body: Commit message body (after first line).
@@ -29,42 +33,31 @@ class Commit:
     author_name: str
     author_email: str
     timestamp: int
+    subject: str = field(init=False)
+    body: str | None = field(init=False)
 
-    @property
-    def subject(self) -> str:
-        """First line of commit message."""
-        return self.message.split("\n", 1)[0]
-
-    @property
-    def body(self) -> str | None:
-        """Commit message body (after first line)."""
-        parts = self.message.split("\n", 1)
-        if len(parts) > 1:
-            return parts[1].strip()
-        return None
+    def __post_init__(self) -> None:
+        # Split the message once here instead of on every attribute access
+        subject, newline, rest = self.message.partition("\n")
+        object.__setattr__(self, "subject", subject)
+        object.__setattr__(self, "body", rest.strip() if newline else None)
 
 
 # Format for git log output (fields separated by special delimiter)
-# Uses record separator (%x1e) at end to handle bodies with newlines
-LOG_FORMAT = "%H%x00%h%x00%s%x00%b%x00%an%x00%ae%x00%ct%x1e"
+# The record separator (%x1e) leads each record so the newline git appends
+# after it lands at the end of the timestamp, where int() ignores it
+LOG_FORMAT = "%x1e%H%x00%s%x00%b%x00%an%x00%ae%x00%ct"
 FIELD_SEPARATOR = "\x00"
 COMMIT_SEPARATOR = "\x1e"  # Record separator
 
+# Length of Commit.short_sha. It is sliced from the full SHA rather than
+# requested via %h, which makes git probe the object db for each commit.
+SHORT_SHA_LENGTH = 7
 
-def parse_commit_line(line: str) -> Commit | None:
-    """Parse a single commit from git log output.
-
-    Args:
-        line: Output line from git log with LOG_FORMAT.
-
-    Returns:
-        Parsed Commit or None if parsing fails.
-    """
-    parts = line.split(FIELD_SEPARATOR)
-    if len(parts) < 7:
-        return None
 
-    sha, short_sha, subject, body, author_name, author_email, timestamp_str = parts[:7]
+def _commit_from_fields(fields: Sequence[str]) -> Commit:
+    """Build a Commit from the first six LOG_FORMAT fields."""
+    sha, subject, body, author_name, author_email, timestamp_str = fields[:6]
 
     try:
         timestamp = int(timestamp_str)
@@ -72,20 +65,40 @@ def parse_commit_line(line: str) -> Commit | None:
         timestamp = 0
 
     # Combine subject and body for full message
-    message = subject
-    if body.strip():
-        message = f"{subject}\n\n{body}"
+    message = f"{subject}\n\n{body}" if body and not body.isspace() else subject
 
+    # Long histories have few distinct authors; share one string per author
     return Commit(
         sha=sha,
-        short_sha=short_sha,
+        short_sha=sha[:SHORT_SHA_LENGTH],
         message=message,
-        author_name=author_name,
-        author_email=author_email,
+        author_name=sys.intern(author_name),
+        author_email=sys.intern(author_email),
         timestamp=timestamp,
     )
 
 
+def parse_commit_line(line: str) -> Commit | None:
+    """Parse a single commit from git log output.
+
+    Args:
+        line: One LOG_FORMAT record, without its record separator.
+
+    Returns:
+        Parsed Commit or None if parsing fails.
+    """
+    parts = line.split(FIELD_SEPARATOR, 5)
+    if len(parts) < 6:
+        return None
+    return _commit_from_fields(parts)
+
+
+def _parse_log_records(records: Iterable[str]) -> list[Commit]:
+    """Parse git log output records produced with LOG_FORMAT."""
+    fields = (record.split(FIELD_SEPARATOR, 5) for record in records)
+    return [_commit_from_fields(parts) for parts in fields if len(parts) == 6]
+
+
 def get_commits(
     cwd: Path,
     since: str | None = None,
@@ -120,18 +133,171 @@ def get_commits(
     if path:
         args.extend(["--", str(path)])
 
+    # Parse records as git produces them rather than buffering the whole log
+    return _parse_log_records(run_git_command_stream(args, cwd=cwd, separator=COMMIT_SEPARATOR))
+
+
+class _PrefixIndex:
+    """Sorted index of path prefixes for finding the ones containing a file.
+
+    Each file is classified with a single bisect instead of being checked
+    against every prefix; nested prefixes are linked to their closest
+    enclosing one so a file is attributed to every prefix that contains it.
+    """
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self._prefixes = sorted(set(prefixes))
+        self._enclosing: list[int] = []
+        stack: list[int] = []
+        for i, prefix in enumerate(self._prefixes):
+            while stack and not prefix.startswith(self._prefixes[stack[-1]]):
+                stack.pop()
+            self._enclosing.append(stack[-1] if stack else -1)
+            stack.append(i)
+
+    def owners(self, files: Iterable[str]) -> set[str]:
+        """Get the prefixes containing any of the given POSIX file paths."""
+        prefixes = self._prefixes
+        found: set[str] = set()
+        for file in files:
+            # A trailing slash lets a prefix naming the file itself match too
+            probe = file + "/"
+            i = bisect_right(prefixes, probe) - 1
+            while i >= 0:
+                if probe.startswith(prefixes[i]):
+                    found.add(prefixes[i])
+                i = self._enclosing[i]
+        return found
+
+
+# Format for a repo-wide git log that also lists parents and touched files.
+# The record separator leads each record so the --name-only file list
+# that git appends after the formatted header stays inside its record.
+_FILES_LOG_FORMAT = "%x1e%H%x00%s%x00%b%x00%an%x00%ae%x00%ct%x00%P%x00"
+
+
+def get_commits_for_paths(
+    cwd: Path,
+    targets: Mapping[str, tuple[Path, str | None]],
+) -> dict[str, list[Commit]]:
+    """Get commits affecting several paths with a single git log call.
+
+    Equivalent to calling get_commits(cwd, since=since, path=path) for each
+    target, but history is read once for the union of all ranges and
+    commits are assigned to targets in memory by the files they touch.
+
+    Args:
+        cwd: Working directory (repository or workspace root).
+        targets: Mapping of key to (path, since) where since is the start
+            reference (exclusive) or None for the full history.
+
+    Returns:
+        Dictionary mapping each key to its commits (newest first).
+    """
+    if not targets:
+        return {}
+
+    # Resolve each since reference to the commit it points to
+    refs = sorted({since for _, since in targets.values() if since})
+    ref_shas: dict[str, str] = {}
+    if refs:
+        result = run_git_command(["rev-parse", *(f"{r}^{{commit}}" for r in refs)], cwd=cwd)
+        ref_shas = dict(zip(refs, result.stdout.split(), strict=True))
+
+    # Only history newer than the common ancestor of every range is needed
+    # -m lists a merge's files once per parent it differs from, so a merge can
+    # be kept exactly when git log -- path would keep it: the path differs
+    # from every parent
+    args = ["log", f"--format={_FILES_LOG_FORMAT}", "-m", "--name-only", "--no-renames"]
+    args += ["--relative", "HEAD"]
+    cutoff: str | None = None
+    if ref_shas and all(since for _, since in targets.values()):
+        result = run_git_command(
+            ["merge-base", "--octopus", *ref_shas.values()], cwd=cwd, check=False
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            cutoff = result.stdout.strip()
+            args += ["--not", cutoff]
+
     result = run_git_command(args, cwd=cwd)
 
     commits: list[Commit] = []
-    # Split by record separator to handle bodies with newlines
+    parents: dict[str, list[str]] = {}
+    # Per commit, the files it touches relative to each parent (merges are
+    # reported once per parent they differ from, in consecutive records)
+    files: list[list[list[str]]] = []
     for record in result.stdout.split(COMMIT_SEPARATOR):
-        record = record.strip()
-        if record:
-            commit = parse_commit_line(record)
-            if commit:
-                commits.append(commit)
-
-    return commits
+        parts = record.split(FIELD_SEPARATOR)
+        if len(parts) < 8:
+            continue
+        touched = [line for line in parts[7].splitlines() if line]
+        if commits and commits[-1].sha == parts[0]:
+            files[-1].append(touched)
+            continue
+        commit = _commit_from_fields(parts)
+        commits.append(commit)
+        parents[commit.sha] = parts[6].split()
+        files.append([touched])
+
+    # Each target's path as a POSIX prefix relative to cwd ("" for cwd itself)
+    root = cwd.resolve()
+    target_prefixes: dict[str, str] = {}
+    for key, (path, _) in targets.items():
+        try:
+            rel = path.resolve().relative_to(root).as_posix()
+        except ValueError:
+            rel = path.as_posix()
+        target_prefixes[key] = "" if rel == "." else rel + "/"
+
+    # Classify every commit once: the prefixes it touches relative to each
+    # parent, intersected so a merge counts only where it differs from all
+    index = _PrefixIndex(target_prefixes.values())
+    hits: dict[str, list[Commit]] = {}
+    for commit, per_parent in zip(commits, files, strict=True):
+        # A parent missing from the log output has no differing files
+        if len(per_parent) < len(parents[commit.sha]):
+            continue
+        owners = index.owners(per_parent[0])
+        for touched in per_parent[1:]:
+            owners &= index.owners(touched)
+        for prefix in owners:
+            hits.setdefault(prefix, []).append(commit)
+
+    found: dict[str, list[Commit]] = {}
+    reachable_cache: dict[str, set[str]] = {}
+    for key, (path, since) in targets.items():
+        matched = hits.get(target_prefixes[key], [])
+        if not since:
+            found[key] = list(matched)
+            continue
+
+        sha = ref_shas[since]
+        # Every since reachable from HEAD is either logged or the cutoff
+        # itself; anything else (e.g. a tag on a release branch) has
+        # ancestry the log cannot see, so ask git for that range directly
+        if sha not in parents and sha != cutoff:
+            found[key] = get_commits(cwd, since=since, path=path)
+            continue
+
+        # Commits already reachable from since are outside since..HEAD
+        if sha not in reachable_cache:
+            reachable_cache[sha] = _reachable_within(sha, parents)
+        excluded = reachable_cache[sha]
+        found[key] = [commit for commit in matched if commit.sha not in excluded]
+
+    return found
+
+
+def _reachable_within(start: str, parents: Mapping[str, list[str]]) -> set[str]:
+    """Collect commits reachable from start, limited to those in parents."""
+    reachable: set[str] = set()
+    stack = [start]
+    while stack:
+        sha = stack.pop()
+        if sha in parents and sha not in reachable:
+            reachable.add(sha)
+            stack.extend(parents[sha])
+    return reachable
 
 
 def get_commit(cwd: Path, ref: str) -> Commit | None:
@@ -144,16 +310,49 @@ def get_commit(cwd: Path, ref: str) -> Commit | None:
     Returns:
         Commit or None if not found.
     """
+    # Reuse the long-lived cat-file process when the caller opened one
+    session = get_batch_session(cwd)
+    if session is not None:
+        obj = session.read_object(f"{ref}^{{commit}}")
+        return _commit_from_object(obj[0], obj[2]) if obj else None
+
     args = ["log", "-1", f"--format={LOG_FORMAT}", ref]
 
     result = run_git_command(args, cwd=cwd, check=False)
     if result.returncode != 0:
         return None
 
-    line = result.stdout.strip()
-    if line:
-        return parse_commit_line(line)
-    return None
+    commits = _parse_log_records(result.stdout.split(COMMIT_SEPARATOR))
+    return commits[0] if commits else None
+
+
+def _commit_from_object(sha: str, content: bytes) -> Commit:
+    """Build a Commit from a raw commit object, as git log would format it."""
+    headers, _, raw_message = content.partition(b"\n\n")
+
+    author_name = author_email = ""
+    timestamp_str = "0"
+    for line in headers.decode("utf-8", errors="replace").split("\n"):
+        if line.startswith("author "):
+            ident, timestamp_str, _ = line[7:].rsplit(" ", 2)
+            name, _, email = ident.rpartition("<")
+            author_name, author_email = name.strip(), email.rstrip(">")
+            break
+
+    # %s is the first paragraph joined onto one line; %b is everything after it
+    lines = raw_message.decode("utf-8", errors="replace").split("\n")
+    i = 0
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    start = i
+    while i < len(lines) and lines[i].strip():
+        i += 1
+    subject = " ".join(line.rstrip() for line in lines[start:i])
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    body = "\n".join(lines[i:])
+
+    return _commit_from_fields([sha, subject, body, author_name, author_email, timestamp_str])
 
 
 def get_commits_affecting_path(
@@ -4,30 +4,41 @@ from __future__ import annotations
 
 import asyncio
 import subprocess
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from pathlib import Path
+from types import TracebackType
 
 from pymelos.errors import GitError
 
 
-def is_git_repo(path: Path) -> bool:
+def is_git_repo(path: Path, *, strict: bool = False) -> bool:
     """Check if path is inside a git repository.
 
+    By default this looks for a ``.git`` directory or file in path and its
+    parents, the way git discovers repositories, without running git.
+
     Args:
         path: Path to check.
+        strict: Ask git itself instead, honouring GIT_DIR,
+            GIT_CEILING_DIRECTORIES and similar settings.
 
     Returns:
-        True if path is inside a git repository.
+        True if path is inside a git repository; False if path doesn't exist.
     """
+    if not strict:
+        # git can't run in a missing directory, so neither check may pass
+        if not path.exists():
+            return False
+        resolved = path.resolve()
+        return any((directory / ".git").exists() for directory in (resolved, *resolved.parents))
+
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
+        return run_git_command_quiet(["rev-parse", "--git-dir"], cwd=path) == 0
+    except GitError:
         return False
 
 
@@ -66,6 +77,7 @@ def run_git_command(
     cwd: Path | None = None,
     *,
     check: bool = True,
+    input: str | None = None,
 ) -> subprocess.CompletedProcess[str]:
     """Run a git command synchronously.
 
@@ -73,6 +85,7 @@ def run_git_command(
         args: Git command arguments (without 'git').
         cwd: Working directory.
         check: Raise on non-zero exit code.
+        input: Text to write to the command's stdin.
 
     Returns:
         Completed process result.
@@ -89,6 +102,7 @@ def run_git_command(
             capture_output=True,
             text=True,
             check=False,
+            input=input,
         )
         if check and result.returncode != 0:
             raise GitError(
@@ -100,6 +114,234 @@ def run_git_command(
         raise GitError("Git is not installed") from e
 
 
+def run_git_command_quiet(args: list[str], cwd: Path | None = None) -> int:
+    """Run a git command for its exit code only.
+
+    Output is discarded at the OS level instead of being captured and
+    decoded, for checks where only success or failure matters.
+
+    Args:
+        args: Git command arguments (without 'git').
+        cwd: Working directory.
+
+    Returns:
+        Exit code.
+
+    Raises:
+        GitError: If git is not installed.
+    """
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        ).returncode
+    except FileNotFoundError as e:
+        raise GitError("Git is not installed") from e
+
+
+def run_git_command_stream(
+    args: list[str],
+    cwd: Path | None = None,
+    *,
+    separator: str,
+    check: bool = True,
+) -> Iterator[str]:
+    """Run a git command and yield its output record by record.
+
+    Output is read in chunks and split on separator as it arrives, so only
+    the current record is held in memory instead of the full stdout.
+
+    Args:
+        args: Git command arguments (without 'git').
+        cwd: Working directory.
+        separator: Single-byte ASCII record separator in the output.
+        check: Raise on non-zero exit code.
+
+    Yields:
+        Decoded output records, without the separator.
+
+    Raises:
+        GitError: If command fails and check is True.
+    """
+    cmd = ["git"] + args
+    sep = separator.encode()
+
+    # stderr goes to a temporary file rather than a pipe: a pipe nobody reads
+    # until stdout ends would block git once it fills, deadlocking the read
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            process = subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            )
+        except FileNotFoundError as e:
+            raise GitError("Git is not installed") from e
+
+        assert process.stdout is not None
+        finished = False
+        try:
+            pending = b""
+            while chunk := process.stdout.read(65536):
+                *records, pending = (pending + chunk).split(sep)
+                for record in records:
+                    yield record.decode("utf-8", errors="replace")
+            yield pending.decode("utf-8", errors="replace")
+            finished = True
+        finally:
+            if not finished:
+                # Consumer stopped early; don't wait for the rest of the output
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+    if check and returncode != 0:
+        raise GitError(
+            stderr.strip() or f"Command failed with exit code {returncode}",
+            command=" ".join(cmd),
+        )
+
+
+class GitBatchSession:
+    """A long-lived ``git cat-file --batch`` process for reading many objects.
+
+    Entering the session spawns one git process; object lookups are then
+    written to its stdin instead of forking git for each one. While the
+    session is active, functions that support it (such as get_commit) use it
+    for lookups in the same repository. SHA-only lookups (resolve) go to a
+    second ``git cat-file --batch-check`` process started on first use.
+
+    Example:
+        with GitBatchSession(root):
+            commits = [get_commit(root, ref) for ref in refs]
+    """
+
+    def __init__(self, cwd: Path) -> None:
+        """Initialize the session.
+
+        Args:
+            cwd: Repository directory.
+        """
+        self.cwd = cwd
+        self._process: subprocess.Popen[bytes] | None = None
+        self._check_process: subprocess.Popen[bytes] | None = None
+        self._token: Token[GitBatchSession | None] | None = None
+
+    def _spawn(self, mode: str) -> subprocess.Popen[bytes]:
+        try:
+            return subprocess.Popen(
+                ["git", "cat-file", mode],
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            raise GitError("Git is not installed") from e
+
+    def __enter__(self) -> GitBatchSession:
+        self._process = self._spawn("--batch")
+        self._token = _active_batch_session.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            _active_batch_session.reset(self._token)
+            self._token = None
+        for process in (self._process, self._check_process):
+            if process is not None:
+                assert process.stdin is not None and process.stdout is not None
+                process.stdin.close()
+                process.stdout.close()
+                process.wait()
+        self._process = self._check_process = None
+
+    def read_object(self, ref: str) -> tuple[str, str, bytes] | None:
+        """Read a git object.
+
+        Args:
+            ref: Object name or revision expression (e.g. "HEAD", "v1.0^{commit}").
+
+        Returns:
+            Tuple of (sha, object type, raw content), or None if ref doesn't
+            name an object.
+
+        Raises:
+            GitError: If the session is not active.
+        """
+        process = self._process
+        if process is None or process.stdin is None or process.stdout is None:
+            raise GitError("Git batch session is not active", command="git cat-file --batch")
+
+        process.stdin.write(ref.encode() + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline().decode().split()
+        if len(header) != 3:
+            # "<ref> missing" or "<ref> ambiguous"
+            return None
+        sha, obj_type, size = header
+        content = process.stdout.read(int(size) + 1)[:-1]  # trailing newline
+        return sha, obj_type, content
+
+    def resolve(self, ref: str) -> str | None:
+        """Resolve a revision expression to an object SHA.
+
+        Args:
+            ref: Revision expression (e.g. "HEAD", "v1.0^{commit}").
+
+        Returns:
+            The object SHA, or None if ref doesn't name an object.
+
+        Raises:
+            GitError: If the session is not active.
+        """
+        if self._process is None:
+            raise GitError("Git batch session is not active", command="git cat-file --batch-check")
+        if self._check_process is None:
+            self._check_process = self._spawn("--batch-check")
+        process = self._check_process
+        assert process.stdin is not None and process.stdout is not None
+
+        process.stdin.write(ref.encode() + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline().decode().split()
+        return header[0] if len(header) == 3 else None
+
+
+_active_batch_session: ContextVar[GitBatchSession | None] = ContextVar(
+    "pymelos_git_batch_session", default=None
+)
+
+
+def get_batch_session(cwd: Path) -> GitBatchSession | None:
+    """Get the active batch session for a repository, if any.
+
+    Args:
+        cwd: Repository directory.
+
+    Returns:
+        The active session when it was opened for cwd, else None.
+    """
+    session = _active_batch_session.get()
+    if session is not None and session.cwd == cwd:
+        return session
+    return None
+
+
 async def run_git_command_async(
     args: list[str],
     cwd: Path | None = None,
@@ -165,6 +407,10 @@ def get_current_commit(cwd: Path | None = None) -> str:
     Returns:
         Current commit SHA.
     """
+    session = get_batch_session(cwd) if cwd is not None else None
+    if session is not None and (sha := session.resolve("HEAD")) is not None:
+        return sha
+
     result = run_git_command(["rev-parse", "HEAD"], cwd=cwd)
     return result.stdout.strip()
 
@@ -182,6 +428,24 @@ def is_clean(cwd: Path | None = None) -> bool:
     return not result.stdout.strip()
 
 
+# Queries that decide the default branch; independent of each other
+_DEFAULT_BRANCH_QUERIES = (
+    ["symbolic-ref", "refs/remotes/origin/HEAD"],
+    ["branch", "--list", "main"],
+)
+
+
+def _default_branch_from(origin_head: tuple[int, str], main_branch: tuple[int, str]) -> str:
+    """Pick the default branch from (returncode, stdout) of _DEFAULT_BRANCH_QUERIES."""
+    returncode, stdout = origin_head
+    if returncode == 0:
+        # refs/remotes/origin/main -> main
+        return stdout.strip().split("/")[-1]
+
+    # Use main if it exists, else default to master
+    return "main" if main_branch[1].strip() else "master"
+
+
 def get_default_branch(cwd: Path | None = None) -> str:
     """Get the default branch name (main or master).
 
@@ -191,20 +455,95 @@ def get_default_branch(cwd: Path | None = None) -> str:
     Returns:
         Default branch name.
     """
-    # Try to get from remote
-    result = run_git_command(
-        ["symbolic-ref", "refs/remotes/origin/HEAD"],
-        cwd=cwd,
-        check=False,
+    # Both candidates are checked at once rather than one after the other
+    with ThreadPoolExecutor(max_workers=len(_DEFAULT_BRANCH_QUERIES)) as pool:
+        origin_head, main_branch = pool.map(
+            lambda args: run_git_command(args, cwd=cwd, check=False), _DEFAULT_BRANCH_QUERIES
+        )
+    return _default_branch_from(
+        (origin_head.returncode, origin_head.stdout),
+        (main_branch.returncode, main_branch.stdout),
     )
-    if result.returncode == 0:
-        # refs/remotes/origin/main -> main
-        return result.stdout.strip().split("/")[-1]
 
-    # Check if main exists
-    result = run_git_command(["branch", "--list", "main"], cwd=cwd, check=False)
-    if result.stdout.strip():
-        return "main"
 
-    # Default to master
-    return "master"
+@dataclass(frozen=True, slots=True)
+class RepoSnapshot:
+    """Repository state gathered in one round of concurrent git queries.
+
+    Attributes:
+        branch: Current branch name ("HEAD" when detached).
+        head: Current commit SHA.
+        is_clean: Whether the working directory has no uncommitted changes.
+        default_branch: Default branch name (see get_default_branch).
+    """
+
+    branch: str
+    head: str
+    is_clean: bool
+    default_branch: str
+
+
+_SNAPSHOT_QUERIES = (
+    ["rev-parse", "--abbrev-ref", "HEAD"],
+    ["rev-parse", "HEAD"],
+    ["status", "--porcelain"],
+    *_DEFAULT_BRANCH_QUERIES,
+)
+
+
+def _snapshot_from(outputs: list[tuple[int, str]]) -> RepoSnapshot:
+    """Build a RepoSnapshot from (returncode, stdout) of _SNAPSHOT_QUERIES."""
+    branch, head, status, origin_head, main_branch = outputs
+    for args, (returncode, _) in zip(_SNAPSHOT_QUERIES[:2], (branch, head), strict=True):
+        if returncode != 0:
+            raise GitError("Could not read HEAD", command=" ".join(["git", *args]))
+    return RepoSnapshot(
+        branch=branch[1].strip(),
+        head=head[1].strip(),
+        is_clean=not status[1].strip(),
+        default_branch=_default_branch_from(origin_head, main_branch),
+    )
+
+
+def get_repo_snapshot(cwd: Path | None = None) -> RepoSnapshot:
+    """Get the current branch, HEAD, cleanliness and default branch together.
+
+    Equivalent to calling get_current_branch, get_current_commit, is_clean
+    and get_default_branch, but the git queries run concurrently on a small
+    thread pool (so this is safe to call from inside a running event loop).
+
+    Args:
+        cwd: Working directory.
+
+    Returns:
+        Repository snapshot.
+
+    Raises:
+        GitError: If HEAD cannot be read (e.g. no commits yet).
+    """
+    with ThreadPoolExecutor(max_workers=len(_SNAPSHOT_QUERIES)) as pool:
+        results = list(
+            pool.map(lambda args: run_git_command(args, cwd=cwd, check=False), _SNAPSHOT_QUERIES)
+        )
+    return _snapshot_from([(r.returncode, r.stdout) for r in results])
+
+
+async def get_repo_snapshot_async(cwd: Path | None = None) -> RepoSnapshot:
+    """Async version of get_repo_snapshot using asyncio.gather.
+
+    Only a handful of git processes are started, so concurrency is not
+    limited further.
+
+    Args:
+        cwd: Working directory.
+
+    Returns:
+        Repository snapshot.
+
+    Raises:
+        GitError: If HEAD cannot be read (e.g. no commits yet).
+    """
+    results = await asyncio.gather(
+        *(run_git_command_async(args, cwd, check=False) for args in _SNAPSHOT_QUERIES)
+    )
+    return _snapshot_from([(returncode, stdout) for returncode, stdout, _ in results])
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import re
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from pymelos.git.repo import run_git_command
+from pymelos.git.changes import clear_ref_cache
+from pymelos.git.repo import get_batch_session, run_git_command
 
 
 @dataclass(frozen=True, slots=True)
@@ -24,6 +28,11 @@ class Tag:
     is_annotated: bool = False
 
 
+_FULL_SHA_PATTERN = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+_TAG_FORMAT = "--format=%(refname:short)%00%(objectname:short)%00%(objecttype)"
+
+
 def list_tags(cwd: Path, pattern: str | None = None) -> list[Tag]:
     """List all tags in the repository.
 
@@ -32,16 +41,10 @@ def list_tags(cwd: Path, pattern: str | None = None) -> list[Tag]:
         pattern: Optional glob pattern to filter tags.
 
     Returns:
-        List of tags sorted by version (if semver) or name.
+        List of tags sorted by name.
     """
-    args = ["tag", "-l"]
-    if pattern:
-        args.append(pattern)
-
-    # Also get the commit SHA for each tag
-    args.extend(["--format=%(refname:short)%00%(objectname:short)%00%(objecttype)"])
-
-    result = run_git_command(args, cwd=cwd)
+    ref_pattern = f"refs/tags/{pattern}" if pattern else "refs/tags/"
+    result = run_git_command(["for-each-ref", _TAG_FORMAT, ref_pattern], cwd=cwd)
 
     tags: list[Tag] = []
     for line in result.stdout.strip().split("\n"):
@@ -61,6 +64,27 @@ def list_tags(cwd: Path, pattern: str | None = None) -> list[Tag]:
     return tags
 
 
+def list_all_tags_grouped(cwd: Path) -> dict[str, list[Tag]]:
+    """List package tags grouped by package name.
+
+    Tags are read with a single git call and split on their last ``@``
+    ({package_name}@{version}); tags without an ``@`` are omitted.
+
+    Args:
+        cwd: Working directory.
+
+    Returns:
+        Dictionary mapping package name to its tags, sorted by name.
+    """
+    grouped: defaultdict[str, list[Tag]] = defaultdict(list)
+    for tag in list_tags(cwd):
+        package_name, sep, _ = tag.name.rpartition("@")
+        if sep:
+            grouped[package_name].append(tag)
+
+    return dict(grouped)
+
+
 def get_latest_tag(
     cwd: Path,
     pattern: str | None = None,
@@ -68,6 +92,9 @@ def get_latest_tag(
 ) -> Tag | None:
     """Get the latest tag, optionally matching a pattern.
 
+    The latest tag is the highest version (by git's version sort) among the
+    tags reachable from HEAD.
+
     Args:
         cwd: Working directory.
         pattern: Glob pattern for tag names.
@@ -76,27 +103,32 @@ def get_latest_tag(
     Returns:
         Latest tag or None if no tags found.
     """
-    # Use git describe to find the latest tag
-    args = ["describe", "--tags", "--abbrev=0"]
-    if pattern:
-        args.extend(["--match", pattern])
-
+    if prefix and not pattern:
+        pattern = f"{prefix}*"
+
+    # One for-each-ref call yields the name and commit of the highest version
+    # reachable from HEAD; *objectname is the commit behind an annotated tag.
+    args = [
+        "for-each-ref",
+        "--merged=HEAD",
+        "--sort=-v:refname",
+        "--count=1",
+        "--format=%(refname:short)%00%(objectname)%00%(*objectname)",
+        f"refs/tags/{pattern or ''}",
+    ]
     result = run_git_command(args, cwd=cwd, check=False)
     if result.returncode != 0:
         return None
 
-    tag_name = result.stdout.strip()
-    if not tag_name:
+    line = result.stdout.strip()
+    if not line:
         return None
 
+    tag_name, sha, target_sha = line.split("\x00")[:3]
     if prefix and not tag_name.startswith(prefix):
         return None
 
-    # Get the SHA
-    sha_result = run_git_command(["rev-parse", f"{tag_name}^{{commit}}"], cwd=cwd)
-    sha = sha_result.stdout.strip()
-
-    return Tag(name=tag_name, sha=sha)
+    return Tag(name=tag_name, sha=target_sha or sha, is_annotated=bool(target_sha))
 
 
 def get_tags_for_commit(cwd: Path, commit: str) -> list[Tag]:
@@ -109,12 +141,22 @@ def get_tags_for_commit(cwd: Path, commit: str) -> list[Tag]:
     Returns:
         List of tags pointing to the commit.
     """
-    result = run_git_command(["tag", "--points-at", commit], cwd=cwd)
+    result = run_git_command(
+        [
+            "for-each-ref",
+            f"--points-at={commit}",
+            "--format=%(refname:short)%00%(objecttype)",
+            "refs/tags/",
+        ],
+        cwd=cwd,
+    )
 
     tags: list[Tag] = []
-    for name in result.stdout.strip().split("\n"):
-        if name:
-            tags.append(Tag(name=name, sha=commit))
+    for line in result.stdout.strip().split("\n"):
+        if not line:
+            continue
+        name, _, obj_type = line.partition("\x00")
+        tags.append(Tag(name=name, sha=commit, is_annotated=obj_type == "tag"))
 
     return tags
 
@@ -132,7 +174,8 @@ def create_tag(
         cwd: Working directory.
         name: Tag name.
         message: Tag message (creates annotated tag).
-        commit: Commit to tag. Defaults to HEAD.
+        commit: Commit to tag. Defaults to HEAD. Passing a full commit SHA
+            saves resolving the new tag afterwards.
 
     Returns:
         Created tag.
@@ -145,14 +188,103 @@ def create_tag(
         args.append(commit)
 
     run_git_command(args, cwd=cwd)
-
-    # Get the SHA
-    sha_result = run_git_command(["rev-parse", f"{name}^{{commit}}"], cwd=cwd)
-    sha = sha_result.stdout.strip()
+    clear_ref_cache()
+
+    # A full commit SHA is already what the tag points to
+    session = get_batch_session(cwd)
+    if commit and _FULL_SHA_PATTERN.fullmatch(commit):
+        sha = commit
+    elif session is not None and (resolved := session.resolve(f"{name}^{{commit}}")):
+        sha = resolved
+    else:
+        sha_result = run_git_command(["rev-parse", f"{name}^{{commit}}"], cwd=cwd)
+        sha = sha_result.stdout.strip()
 
     return Tag(name=name, sha=sha, is_annotated=bool(message))
 
 
+@dataclass(frozen=True, slots=True)
+class TagSpec:
+    """A tag to create with create_tags.
+
+    Attributes:
+        name: Tag name.
+        message: Tag message (creates annotated tag).
+        commit: Commit to tag. Defaults to HEAD.
+    """
+
+    name: str
+    message: str | None = None
+    commit: str | None = None
+
+
+def create_tags(cwd: Path, specs: Sequence[TagSpec]) -> list[Tag]:
+    """Create several git tags, resolving their target commits once.
+
+    Every target is resolved with a single ``git rev-parse``. Lightweight
+    tags are then written by one atomic ``git update-ref --stdin``
+    transaction: either all of them are created or none are. Annotated tags
+    need a tag object with the tagger identity git works out, so each one
+    still takes its own ``git tag -a`` call, created after the lightweight
+    tags and stopping at the first failure.
+
+    Args:
+        cwd: Working directory.
+        specs: Tags to create.
+
+    Returns:
+        Created tags, in the order of specs.
+
+    Raises:
+        GitError: If a target can't be resolved or a tag can't be created.
+    """
+    if not specs:
+        return []
+
+    # Resolve every target commit with a single rev-parse
+    refs = sorted(
+        {
+            spec.commit or "HEAD"
+            for spec in specs
+            if not (spec.commit and _FULL_SHA_PATTERN.fullmatch(spec.commit))
+        }
+    )
+    resolved: dict[str, str] = {}
+    if refs:
+        result = run_git_command(["rev-parse", *(f"{r}^{{commit}}" for r in refs)], cwd=cwd)
+        resolved = dict(zip(refs, result.stdout.split(), strict=True))
+
+    shas = {
+        spec.name: (
+            spec.commit
+            if spec.commit and _FULL_SHA_PATTERN.fullmatch(spec.commit)
+            else resolved[spec.commit or "HEAD"]
+        )
+        for spec in specs
+    }
+
+    try:
+        # "create" refuses to overwrite an existing ref, just like git tag
+        lightweight = [spec for spec in specs if not spec.message]
+        if lightweight:
+            commands = "".join(
+                f"create refs/tags/{spec.name}\0{shas[spec.name]}\0" for spec in lightweight
+            )
+            run_git_command(["update-ref", "--stdin", "-z"], cwd=cwd, input=commands)
+
+        for spec in specs:
+            if spec.message:
+                run_git_command(
+                    ["tag", "-a", "-m", spec.message, spec.name, shas[spec.name]], cwd=cwd
+                )
+    finally:
+        clear_ref_cache()
+
+    return [
+        Tag(name=spec.name, sha=shas[spec.name], is_annotated=bool(spec.message)) for spec in specs
+    ]
+
+
 def delete_tag(cwd: Path, name: str) -> None:
     """Delete a git tag.
 
@@ -161,13 +293,13 @@ def delete_tag(cwd: Path, name: str) -> None:
         name: Tag name to delete.
     """
     run_git_command(["tag", "-d", name], cwd=cwd)
+    clear_ref_cache()
 
 
-# Pattern to extract version from various tag formats
-_VERSION_PATTERNS = [
-    re.compile(r"^v?(\d+\.\d+\.\d+.*)$"),  # v1.2.3 or 1.2.3
-    re.compile(r"^.+@(\d+\.\d+\.\d+.*)$"),  # pkg@1.2.3
-]
+# Pattern to extract version from various tag formats: v1.2.3 or 1.2.3, then
+# pkg@1.2.3. The v? branch is tried first, so a bare version wins over a
+# package prefix just as when these were separate patterns.
+_VERSION_PATTERN = re.compile(r"^(?:v?|.+@)(\d+\.\d+\.\d+.*)$")
 
 
 def parse_version_from_tag(tag: str, prefix: str = "") -> str | None:
@@ -183,11 +315,8 @@ def parse_version_from_tag(tag: str, prefix: str = "") -> str | None:
     if prefix and tag.startswith(prefix):
         return tag[len(prefix) :]
 
-    for pattern in _VERSION_PATTERNS:
-        if match := pattern.match(tag):
-            return match.group(1)
-
-    return None
+    match = _VERSION_PATTERN.match(tag)
+    return match.group(1) if match else None
 
 
 def get_package_tags(cwd: Path, package_name: str) -> list[Tag]:
@@ -202,13 +331,13 @@ def get_package_tags(cwd: Path, package_name: str) -> list[Tag]:
     Returns:
         List of tags for the package.
     """
-    pattern = f"{package_name}@*"
-    return list_tags(cwd, pattern=pattern)
+    return list(list_all_tags_grouped(cwd).get(package_name, ()))
 
 
 _SEMVER_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)(.*)?")
 
 
+@lru_cache(maxsize=4096)
 def _parse_version_tuple(version: str | None, fallback: str) -> tuple[int, int, int, str]:
     """Parse version string into sortable tuple."""
     if not version:
@@ -231,7 +360,28 @@ def get_latest_package_tag(cwd: Path, package_name: str) -> Tag | None:
     Returns:
         Latest tag for the package or None.
     """
-    tags = get_package_tags(cwd, package_name)
+    return _latest_of(list_all_tags_grouped(cwd).get(package_name), package_name)
+
+
+def get_latest_package_tags(cwd: Path, package_names: Iterable[str]) -> dict[str, Tag | None]:
+    """Get the latest tag for each of several packages.
+
+    Equivalent to calling get_latest_package_tag for each name, but all
+    tags are listed with a single git call.
+
+    Args:
+        cwd: Working directory.
+        package_names: Package names.
+
+    Returns:
+        Dictionary mapping each package name to its latest tag or None.
+    """
+    grouped = list_all_tags_grouped(cwd)
+    return {name: _latest_of(grouped.get(name), name) for name in package_names}
+
+
+def _latest_of(tags: list[Tag] | None, package_name: str) -> Tag | None:
+    """Pick the highest-versioned of a package's tags."""
     if not tags:
         return None
 
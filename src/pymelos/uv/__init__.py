@@ -10,6 +10,7 @@ from pymelos.uv.client import (
 from pymelos.uv.publish import (
     build,
     build_and_publish,
+    build_and_publish_async,
     check_publishable,
     publish,
 )
@@ -40,5 +41,6 @@ __all__ = [
     "build",
     "publish",
     "build_and_publish",
+    "build_and_publish_async",
     "check_publishable",
 ]
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import os
+import shutil
 import subprocess
+from functools import cache
 from pathlib import Path
 
 from pymelos.errors import ExecutionError
 
 
+@cache
 def get_uv_executable() -> str:
     """Get the path to the uv executable.
 
+    The location is looked up once per process; call
+    ``get_uv_executable.cache_clear()`` to look it up again.
+
     Returns:
         Path to uv executable.
 
@@ -20,14 +26,8 @@ def get_uv_executable() -> str:
         ExecutionError: If uv is not installed.
     """
     # Check if uv is in PATH
-    result = subprocess.run(
-        ["which", "uv"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode == 0:
-        return result.stdout.strip()
+    if path := shutil.which("uv"):
+        return path
 
     # Check common locations
     common_paths = [
@@ -143,8 +143,9 @@ async def run_uv_async(
     return exit_code, stdout, stderr
 
 
+@cache
 def get_uv_version() -> str:
-    """Get the installed uv version.
+    """Get the installed uv version (cached like get_uv_executable).
 
     Returns:
         Version string.
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import shutil
+from collections.abc import Sequence
 from pathlib import Path
 
 from pymelos.errors import PublishError
-from pymelos.uv.client import run_uv
+from pymelos.uv.client import run_uv, run_uv_async
 
 
 def build(
@@ -40,28 +44,16 @@ def build(
     return out_dir or (cwd / "dist")
 
 
-def publish(
+def _publish_args(
     cwd: Path,
     *,
-    repository: str | None = None,
-    token: str | None = None,
-    username: str | None = None,
-    password: str | None = None,
-    dist_dir: Path | None = None,
-) -> None:
-    """Publish package to a registry.
-
-    Args:
-        cwd: Package directory.
-        repository: Repository URL.
-        token: API token for authentication.
-        username: Username for authentication.
-        password: Password for authentication.
-        dist_dir: Directory containing distributions.
-
-    Raises:
-        PublishError: If publish fails.
-    """
+    repository: str | None,
+    token: str | None,
+    username: str | None,
+    password: str | None,
+    dist_dir: Path | None,
+) -> list[str]:
+    """Build uv publish arguments, including the distribution files to upload."""
     args = ["publish"]
 
     if repository:
@@ -81,8 +73,13 @@ def publish(
             package_name=cwd.name,
         )
 
-    # Find distribution files
-    dists = list(dist.glob("*.tar.gz")) + list(dist.glob("*.whl"))
+    # Find distribution files in a single directory pass
+    with os.scandir(dist) as entries:
+        dists = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith((".tar.gz", ".whl")) and entry.is_file()
+        ]
     if not dists:
         raise PublishError(
             f"No distributions found in {dist}",
@@ -91,6 +88,39 @@ def publish(
 
     # Add all distribution files
     args.extend(str(d) for d in dists)
+    return args
+
+
+def publish(
+    cwd: Path,
+    *,
+    repository: str | None = None,
+    token: str | None = None,
+    username: str | None = None,
+    password: str | None = None,
+    dist_dir: Path | None = None,
+) -> None:
+    """Publish package to a registry.
+
+    Args:
+        cwd: Package directory.
+        repository: Repository URL.
+        token: API token for authentication.
+        username: Username for authentication.
+        password: Password for authentication.
+        dist_dir: Directory containing distributions.
+
+    Raises:
+        PublishError: If publish fails.
+    """
+    args = _publish_args(
+        cwd,
+        repository=repository,
+        token=token,
+        username=username,
+        password=password,
+        dist_dir=dist_dir,
+    )
 
     try:
         run_uv(args, cwd=cwd)
@@ -116,14 +146,71 @@ def build_and_publish(
     dist_dir = cwd / "dist"
 
     if clean_first and dist_dir.exists():
-        import shutil
-
         shutil.rmtree(dist_dir)
 
     build(cwd)
     publish(cwd, repository=repository, token=token, dist_dir=dist_dir)
 
 
+async def build_and_publish_async(
+    cwds: Sequence[Path],
+    *,
+    repository: str | None = None,
+    token: str | None = None,
+    clean_first: bool = True,
+    concurrency: int = 4,
+) -> None:
+    """Build and publish several packages concurrently.
+
+    Each package is built and then published as in build_and_publish, with
+    at most ``concurrency`` packages in flight so uploads overlap without
+    starting a uv process for every package at once. Packages are not
+    ordered, so use build_and_publish when one must be uploaded before
+    another.
+
+    Args:
+        cwds: Package directories.
+        repository: Repository URL.
+        token: API token.
+        clean_first: Remove existing dist/ before building.
+        concurrency: Maximum number of packages processed at once.
+
+    Raises:
+        PublishError: If any package fails to build or publish; the first
+            failure is raised after all packages have finished.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def build_and_publish_one(cwd: Path) -> None:
+        async with semaphore:
+            dist_dir = cwd / "dist"
+            if clean_first and dist_dir.exists():
+                await asyncio.to_thread(shutil.rmtree, dist_dir)
+
+            try:
+                await run_uv_async(["build"], cwd=cwd)
+                args = _publish_args(
+                    cwd,
+                    repository=repository,
+                    token=token,
+                    username=None,
+                    password=None,
+                    dist_dir=dist_dir,
+                )
+                await run_uv_async(args, cwd=cwd)
+            except PublishError:
+                raise
+            except Exception as e:
+                raise PublishError(str(e), package_name=cwd.name, registry=repository) from e
+
+    results = await asyncio.gather(
+        *(build_and_publish_one(cwd) for cwd in cwds), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 def check_publishable(cwd: Path) -> list[str]:
     """Check if a package can be published.
 
@@ -12,6 +12,7 @@ from pymelos.versioning.conventional import (
     filter_commits_by_type,
     group_commits_by_type,
     is_conventional_commit,
+    may_bump_version,
     parse_commit,
     parse_commit_message,
 )
@@ -41,6 +42,7 @@ __all__ = [
     "parse_commit_message",
     "determine_bump",
     "is_conventional_commit",
+    "may_bump_version",
     "filter_commits_by_type",
     "group_commits_by_type",
     # Changelog
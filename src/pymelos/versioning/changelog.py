@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pymelos.versioning.conventional import ParsedCommit, group_commits_by_type
+from pymelos.versioning.conventional import ParsedCommit
 
 
 def generate_changelog_entry(
@@ -59,14 +60,19 @@ def generate_changelog_entry(
 
     hidden = hidden_types or {"docs", "style", "chore", "ci", "test"}
 
-    # Group commits
-    grouped = group_commits_by_type(commits)
+    # Split commits into breaking changes and the rest by type in one pass
+    breaking_commits: list[ParsedCommit] = []
+    grouped: dict[str, list[ParsedCommit]] = {}
+    for commit in commits:
+        if commit.breaking:
+            breaking_commits.append(commit)
+        else:
+            grouped.setdefault(commit.type, []).append(commit)
 
     # Build sections
     lines: list[str] = [header]
 
     # Breaking changes first
-    breaking_commits = [c for c in commits if c.breaking]
     if breaking_commits:
         lines.append("\n### BREAKING CHANGES\n")
         for commit in breaking_commits:
@@ -86,10 +92,8 @@ def generate_changelog_entry(
         if commit_type in hidden:
             continue
 
-        type_commits = grouped.get(commit_type, [])
-        # Filter out breaking changes (already shown)
-        type_commits = [c for c in type_commits if not c.breaking]
-
+        # Breaking changes were already shown above
+        type_commits = grouped.get(commit_type)
         if not type_commits:
             continue
 
@@ -116,14 +120,8 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 """
 
 
-def _find_insert_index(lines: list[str]) -> int:
-    """Find index to insert new changelog entry."""
-    for i, line in enumerate(lines):
-        if line.startswith("## ["):
-            return i
-        if line.startswith("# ") or not line.strip():
-            continue
-    return len(lines)
+# Start of the first release entry; new entries are inserted before it
+_ENTRY_HEADER_PATTERN = re.compile(rb"^## \[", re.MULTILINE)
 
 
 def prepend_to_changelog(
@@ -145,10 +143,15 @@ def prepend_to_changelog(
         changelog_path.write_text(_create_new_changelog(entry), encoding="utf-8")
         return
 
-    lines = changelog_path.read_text(encoding="utf-8").split("\n")
-    insert_index = _find_insert_index(lines)
-    new_lines = lines[:insert_index] + [entry.strip(), ""] + lines[insert_index:]
-    changelog_path.write_text("\n".join(new_lines), encoding="utf-8")
+    # Splice the entry in as bytes rather than splitting the file into lines
+    data = changelog_path.read_bytes()
+    new_entry = entry.strip().encode("utf-8")
+    if match := _ENTRY_HEADER_PATTERN.search(data):
+        offset = match.start()
+        data = b"".join((data[:offset], new_entry, b"\n\n", data[offset:]))
+    else:
+        data = b"".join((data, b"\n", new_entry, b"\n"))
+    changelog_path.write_bytes(data)
 
 
 def read_changelog(changelog_path: Path) -> str | None:
@@ -165,6 +168,10 @@ def read_changelog(changelog_path: Path) -> str | None:
     return changelog_path.read_text(encoding="utf-8")
 
 
+# Match version headers like: ## [1.2.3] or ## [pkg@1.2.3]
+_CHANGELOG_VERSION_PATTERN = re.compile(r"## \[(?:[\w-]+@)?(\d+\.\d+\.\d+(?:-[\w.]+)?)\]")
+
+
 def get_latest_version_from_changelog(changelog_path: Path) -> str | None:
     """Extract the latest version from a changelog.
 
@@ -178,11 +185,7 @@ def get_latest_version_from_changelog(changelog_path: Path) -> str | None:
     if not content:
         return None
 
-    import re
-
-    # Match version headers like: ## [1.2.3] or ## [pkg@1.2.3]
-    pattern = r"## \[(?:[\w-]+@)?(\d+\.\d+\.\d+(?:-[\w.]+)?)\]"
-    match = re.search(pattern, content)
+    match = _CHANGELOG_VERSION_PATTERN.search(content)
 
     if match:
         return match.group(1)
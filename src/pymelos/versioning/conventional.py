@@ -41,6 +41,17 @@ TYPE_TO_BUMP: dict[str, BumpType] = {
     "revert": BumpType.PATCH,
 }
 
+# Cheap pre-check for messages that could bump the version: a bumping type,
+# any type marked breaking with "!", or a BREAKING CHANGE footer. Matches a
+# superset of what parse_commit_message() would turn into a bump.
+_BUMP_CANDIDATE_PATTERN = re.compile(
+    r"^\s*(?:(?:"
+    + "|".join(t for t, b in TYPE_TO_BUMP.items() if b != BumpType.NONE)
+    + r")(?:\([^)]+\))?!?|\w+(?:\([^)]+\))?!): "
+    r"|BREAKING[- ]CHANGE:",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 @dataclass(frozen=True, slots=True)
 class ParsedCommit:
@@ -144,6 +155,21 @@ def parse_commit(commit: Commit) -> ParsedCommit | None:
     return parse_commit_message(commit.message, commit.sha)
 
 
+def may_bump_version(message: str) -> bool:
+    """Quickly check whether a commit message could require a version bump.
+
+    This is a fast pre-filter: a False result guarantees that parsing the
+    message yields no bump, while True only means it might.
+
+    Args:
+        message: Commit message to check.
+
+    Returns:
+        True if the message may bump the version.
+    """
+    return _BUMP_CANDIDATE_PATTERN.search(message) is not None
+
+
 def determine_bump(commits: list[ParsedCommit]) -> BumpType:
     """Determine the highest bump type from a list of commits.
 
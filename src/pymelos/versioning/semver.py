@@ -4,28 +4,17 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum
+from functools import lru_cache
 
 
-class BumpType(Enum):
-    """Version bump types."""
+class BumpType(IntEnum):
+    """Version bump types, ordered MAJOR > MINOR > PATCH > NONE."""
 
-    MAJOR = auto()
-    MINOR = auto()
-    PATCH = auto()
-    NONE = auto()
-
-    def __gt__(self, other: BumpType) -> bool:
-        if not isinstance(other, BumpType):
-            return NotImplemented
-        # MAJOR > MINOR > PATCH > NONE
-        order = {BumpType.MAJOR: 3, BumpType.MINOR: 2, BumpType.PATCH: 1, BumpType.NONE: 0}
-        return order[self] > order[other]
-
-    def __lt__(self, other: BumpType) -> bool:
-        if not isinstance(other, BumpType):
-            return NotImplemented
-        return not (self > other or self == other)
+    MAJOR = 3
+    MINOR = 2
+    PATCH = 1
+    NONE = 0
 
 
 # SemVer regex pattern
@@ -67,6 +56,20 @@ class Version:
         if version_str.startswith("v"):
             version_str = version_str[1:]
 
+        # Versions are immutable, so repeat parses can share one instance
+        if cls is Version:
+            return _parse_version(version_str)
+        return cls._from_string(version_str)
+
+    @classmethod
+    def _from_string(cls, version_str: str) -> Version:
+        """Parse a version string without a leading 'v'."""
+        # Fast path for plain X.Y.Z; anything else goes through the regex
+        if "-" not in version_str and "+" not in version_str:
+            parts = version_str.split(".")
+            if len(parts) == 3 and all(_is_numeric_identifier(part) for part in parts):
+                return cls(major=int(parts[0]), minor=int(parts[1]), patch=int(parts[2]))
+
         match = SEMVER_PATTERN.match(version_str)
         if not match:
             raise ValueError(f"Invalid semantic version: {version_str}")
@@ -158,17 +161,16 @@ class Version:
 
     def __str__(self) -> str:
         """Convert to version string."""
-        version = f"{self.major}.{self.minor}.{self.patch}"
-        if self.prerelease:
-            version += f"-{self.prerelease}"
-        if self.build:
-            version += f"+{self.build}"
-        return version
+        pre = f"-{self.prerelease}" if self.prerelease else ""
+        build = f"+{self.build}" if self.build else ""
+        return f"{self.major}.{self.minor}.{self.patch}{pre}{build}"
 
     def __lt__(self, other: Version) -> bool:
         """Compare versions for sorting."""
         if not isinstance(other, Version):
             return NotImplemented
+        if self is other:
+            return False
 
         # Compare major.minor.patch
         if (self.major, self.minor, self.patch) != (other.major, other.minor, other.patch):
@@ -187,32 +189,35 @@ class Version:
     @staticmethod
     def _compare_prerelease(a: str, b: str) -> int:
         """Compare prerelease identifiers."""
-        a_parts = a.split(".")
-        b_parts = b.split(".")
-
-        for a_part, b_part in zip(a_parts, b_parts, strict=False):
-            # Numeric identifiers have lower precedence than alphanumeric
-            a_is_num = a_part.isdigit()
-            b_is_num = b_part.isdigit()
-
-            if a_is_num and b_is_num:
-                diff = int(a_part) - int(b_part)
-                if diff != 0:
-                    return diff
-            elif a_is_num:
-                return -1
-            elif b_is_num:
-                return 1
-            else:
-                if a_part < b_part:
-                    return -1
-                if a_part > b_part:
-                    return 1
+        if a == b:
+            return 0
+        key_a, key_b = _prerelease_key(a), _prerelease_key(b)
+        return (key_a > key_b) - (key_a < key_b)
+
+
+@lru_cache(maxsize=1024)
+def _prerelease_key(prerelease: str) -> tuple[tuple[int, int | str], ...]:
+    """Tokenize a prerelease string into a key that sorts by SemVer precedence.
+
+    Numeric identifiers compare numerically and sort before alphanumeric
+    ones, which compare as strings; a shorter prerelease sorts first when
+    all its identifiers are equal, which tuple ordering gives for free. The
+    leading rank means an int is never compared with a str.
+    """
+    return tuple((0, int(part)) if part.isdigit() else (1, part) for part in prerelease.split("."))
+
+
+def _is_numeric_identifier(part: str) -> bool:
+    """Check for a SemVer numeric identifier: ASCII digits without leading zeros."""
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
 
-        # Shorter prerelease has lower precedence
-        return len(a_parts) - len(b_parts)
+@lru_cache(maxsize=4096)
+def _parse_version(version_str: str) -> Version:
+    return Version._from_string(version_str)
 
 
+@lru_cache(maxsize=4096)
 def is_valid_semver(version_str: str) -> bool:
     """Check if a string is a valid semantic version.
 
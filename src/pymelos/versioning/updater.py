@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
 from pymelos.compat import tomllib
 
+# Match: version = "x.y.z"
+_PYPROJECT_VERSION_PATTERN = re.compile(r'(version\s*=\s*["\'])[\d.]+(-[\w.]+)?(["\'])')
+
+# Match: a version = "..." line, capturing the value
+_PROJECT_VERSION_LINE_PATTERN = re.compile(r'^\s*version\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
+# Match: __version__ = "x.y.z"
+_INIT_VERSION_PATTERN = re.compile(r'(__version__\s*=\s*["\'])[\d.]+(-[\w.]+)?(["\'])')
+
 
 def update_pyproject_version(path: Path, new_version: str) -> None:
     """Update version in pyproject.toml.
@@ -18,16 +28,16 @@ def update_pyproject_version(path: Path, new_version: str) -> None:
     content = path.read_text(encoding="utf-8")
 
     # Update version in [project] section
-    # Match: version = "x.y.z"
-    pattern = r'(version\s*=\s*["\'])[\d.]+(-[\w.]+)?(["\'])'
-    replacement = rf"\g<1>{new_version}\g<3>"
-
-    new_content = re.sub(pattern, replacement, content, count=1)
-
-    if new_content == content:
+    match = _PYPROJECT_VERSION_PATTERN.search(content) if "version" in content else None
+    if match is None:
         raise ValueError(f"Could not find version in {path}")
 
-    path.write_text(new_content, encoding="utf-8")
+    # Leave the file untouched when it already has the new version
+    start, end = match.end(1), match.start(3)
+    if content[start:end] == new_version:
+        return
+
+    path.write_text(content[:start] + new_version + content[end:], encoding="utf-8")
 
 
 def get_pyproject_version(path: Path) -> str:
@@ -42,10 +52,20 @@ def get_pyproject_version(path: Path) -> str:
     Raises:
         ValueError: If version not found.
     """
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
+    content = path.read_text(encoding="utf-8")
 
-    version = data.get("project", {}).get("version")
+    # Fast path: a version line whose enclosing table is [project]
+    match = _PROJECT_VERSION_LINE_PATTERN.search(content)
+    if match is not None:
+        header_start = content.rfind("\n[", 0, match.start()) + 1
+        if content.startswith("[", header_start):
+            header_end = content.find("\n", header_start)
+            header = content[header_start:header_end].split("#", 1)[0].strip()
+            if header == "[project]":
+                return match.group(1)
+
+    # Anything else (other tables first, inline tables, ...) gets a full parse
+    version = tomllib.loads(content).get("project", {}).get("version")
     if not version:
         raise ValueError(f"No version found in {path}")
     return version
@@ -65,12 +85,11 @@ def update_init_version(path: Path, new_version: str) -> bool:
         return False
 
     content = path.read_text(encoding="utf-8")
+    if "__version__" not in content:
+        return False
 
-    # Match: __version__ = "x.y.z"
-    pattern = r'(__version__\s*=\s*["\'])[\d.]+(-[\w.]+)?(["\'])'
     replacement = rf"\g<1>{new_version}\g<3>"
-
-    new_content = re.sub(pattern, replacement, content)
+    new_content = _INIT_VERSION_PATTERN.sub(replacement, content)
 
     if new_content == content:
         return False
@@ -79,6 +98,33 @@ def update_init_version(path: Path, new_version: str) -> bool:
     return True
 
 
+# Top-level directories that never hold the package's own __init__.py
+_SKIPPED_PACKAGE_DIRS = frozenset({"tests", "node_modules"})
+
+
+def _find_init_files(directory: Path, skip: frozenset[str]) -> list[Path]:
+    """List <directory>/*/__init__.py files with a single scandir pass.
+
+    Hidden directories (.git, .venv, ...) and names in ``skip`` are ignored.
+
+    Args:
+        directory: Directory whose subdirectories are checked.
+        skip: Subdirectory names to ignore.
+
+    Returns:
+        Paths to the __init__.py files found.
+    """
+    found: list[Path] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in skip or not entry.is_dir():
+                continue
+            init_file = os.path.join(entry.path, "__init__.py")
+            if os.path.isfile(init_file):
+                found.append(Path(init_file))
+    return found
+
+
 def find_version_files(package_path: Path) -> list[Path]:
     """Find files that might contain version information.
 
@@ -98,13 +144,10 @@ def find_version_files(package_path: Path) -> list[Path]:
     # src/<package>/__init__.py
     src_dir = package_path / "src"
     if src_dir.is_dir():
-        for init_file in src_dir.glob("*/__init__.py"):
-            files.append(init_file)
+        files.extend(_find_init_files(src_dir, frozenset()))
 
     # Direct __init__.py
-    for init_file in package_path.glob("*/__init__.py"):
-        if init_file.parent.name != "tests":
-            files.append(init_file)
+    files.extend(_find_init_files(package_path, _SKIPPED_PACKAGE_DIRS))
 
     return files
 
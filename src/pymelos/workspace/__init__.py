@@ -9,9 +9,12 @@ from pymelos.workspace.discovery import (
 from pymelos.workspace.graph import DependencyGraph
 from pymelos.workspace.package import (
     Package,
+    clear_package_cache,
     get_package_name_from_path,
     load_package,
+    load_package_from_data,
     parse_dependency_name,
+    read_package_data,
 )
 from pymelos.workspace.workspace import Workspace
 
@@ -21,6 +24,9 @@ __all__ = [
     # Package
     "Package",
     "load_package",
+    "clear_package_cache",
+    "load_package_from_data",
+    "read_package_data",
     "parse_dependency_name",
     "get_package_name_from_path",
     # Graph
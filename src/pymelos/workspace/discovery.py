@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from pymelos.config import PyMelosConfig
-from pymelos.workspace.package import Package, get_package_name_from_path, load_package
+from pymelos.workspace.package import Package, load_package_from_data, read_package_data
 
 
 def expand_package_patterns(
@@ -24,8 +29,37 @@ def expand_package_patterns(
     Returns:
         List of paths to package directories (containing pyproject.toml).
     """
-    ignore_patterns = ignore_patterns or []
-    package_paths: list[Path] = []
+    # Resolve each kept path once; dict.fromkeys drops symlinked aliases in order
+    unique_paths = dict.fromkeys(
+        p.resolve() for p in _iter_package_dirs(root, patterns, ignore_patterns)
+    )
+    return sorted(unique_paths, key=lambda p: p.name)
+
+
+def _iter_package_dirs(
+    root: Path,
+    patterns: list[str],
+    ignore_patterns: list[str] | None,
+) -> Iterator[Path]:
+    """Yield unresolved package directories as the glob walk finds them.
+
+    Args:
+        root: Workspace root directory.
+        patterns: Glob patterns like ["packages/*", "libs/*"].
+        ignore_patterns: Patterns to exclude.
+
+    Yields:
+        Directories containing a pyproject.toml that are not ignored.
+    """
+    # One regex match per name instead of an fnmatch call per ignore pattern
+    ignore_re = (
+        re.compile(
+            "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in ignore_patterns)
+        )
+        if ignore_patterns
+        else None
+    )
+    seen: set[Path] = set()
 
     for pattern in patterns:
         # Handle both relative and absolute patterns
@@ -33,6 +67,11 @@ def expand_package_patterns(
 
         # Expand the glob pattern
         for path in root.glob(base_pattern):
+            # Paths matched by several patterns are only checked once
+            if path in seen:
+                continue
+            seen.add(path)
+
             if not path.is_dir():
                 continue
 
@@ -40,29 +79,19 @@ def expand_package_patterns(
             if not (path / "pyproject.toml").is_file():
                 continue
 
-            # Check ignore patterns
-            rel_path = path.relative_to(root)
-            rel_str = str(rel_path)
+            # Check ignore patterns (normcase mirrors fnmatch.fnmatch)
+            if ignore_re is not None:
+                rel_str = os.path.normcase(str(path.relative_to(root)))
+                if ignore_re.match(rel_str) or ignore_re.match(os.path.normcase(path.name)):
+                    continue
 
-            ignored = False
-            for ignore in ignore_patterns:
-                if fnmatch.fnmatch(rel_str, ignore) or fnmatch.fnmatch(path.name, ignore):
-                    ignored = True
-                    break
+            yield path
 
-            if not ignored:
-                package_paths.append(path)
 
-    # Remove duplicates while preserving order
-    seen: set[Path] = set()
-    unique_paths: list[Path] = []
-    for p in package_paths:
-        resolved = p.resolve()
-        if resolved not in seen:
-            seen.add(resolved)
-            unique_paths.append(resolved)
-
-    return sorted(unique_paths, key=lambda p: p.name)
+def _resolve_and_read(path: Path) -> tuple[Path, dict[str, Any]]:
+    """Resolve a package directory and read its pyproject.toml."""
+    resolved = path.resolve()
+    return resolved, read_package_data(resolved)
 
 
 def discover_packages(
@@ -76,26 +105,37 @@ def discover_packages(
         config: Workspace configuration.
 
     Returns:
-        Dictionary mapping package names to Package instances.
+        Dictionary mapping package names to Package instances, ordered by name.
     """
-    # First pass: find all package paths and their names
-    package_paths = expand_package_patterns(root, config.packages, config.ignore)
+    paths = list(_iter_package_dirs(root, config.packages, config.ignore))
+    if not paths:
+        return {}
+
+    # Read the pyproject.toml files on a pool sized to the work; results are
+    # taken in walk order, re-raising the first failure
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        read = dict(pool.map(_resolve_and_read, paths))
+
+    # Same de-duplication and order as expand_package_patterns
+    parsed = sorted(read.items(), key=lambda item: item[0].name)
 
-    # Get all package names for workspace dependency detection
+    # Collect the workspace names from the parsed data
     workspace_package_names: set[str] = set()
-    for path in package_paths:
-        name = get_package_name_from_path(path)
+    for _, data in parsed:
+        name = data.get("project", {}).get("name")
         if name:
             # Normalize name for comparison
             workspace_package_names.add(name.lower().replace("-", "_"))
 
-    # Second pass: fully load all packages
+    # Build packages from the data the workers already parsed; the paths
+    # were resolved by the readers too
     packages: dict[str, Package] = {}
-    for path in package_paths:
-        package = load_package(path, workspace_package_names)
+    for path, data in parsed:
+        package = load_package_from_data(path, data, workspace_package_names, resolved=True)
         packages[package.name] = package
 
-    return packages
+    # Keep packages ordered by name so callers can emit sorted output directly
+    return dict(sorted(packages.items()))
 
 
 def find_package_at_path(
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import sys
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
+from functools import cached_property
 from graphlib import CycleError, TopologicalSorter
 
 from pymelos.errors import CyclicDependencyError
@@ -16,30 +19,49 @@ class DependencyGraph:
 
     Attributes:
         packages: Dictionary of package name to Package.
-        _sorter: Cached TopologicalSorter instance.
+        _reverse_edges: Dependents of each package, computed on first use.
+        _layers: Topological waves of package names, computed on first use.
     """
 
     packages: dict[str, Package]
     _edges: dict[str, set[str]] = field(default_factory=dict, init=False)
-    _reverse_edges: dict[str, set[str]] = field(default_factory=dict, init=False)
+    _trans_deps: dict[str, frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _trans_dependents: dict[str, frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Build the dependency edges."""
+        # Interned names let dict and set lookups in traversals hit on identity
+        self.packages = {sys.intern(name): pkg for name, pkg in self.packages.items()}
+
         # Initialize edge sets
         for name in self.packages:
             self._edges[name] = set()
-            self._reverse_edges[name] = set()
+
+        # Map normalized names to real names once; the first package wins on collisions
+        normalized: dict[str, str] = {}
+        for pkg_name, package in self.packages.items():
+            normalized.setdefault(package.normalized_name, pkg_name)
 
         # Build edges: package -> its workspace dependencies
         for name, package in self.packages.items():
             for dep in package.workspace_dependencies:
-                # Normalize and check if dependency exists in workspace
-                normalized_dep = dep.lower().replace("-", "_")
-                for pkg_name in self.packages:
-                    if pkg_name.lower().replace("-", "_") == normalized_dep:
-                        self._edges[name].add(pkg_name)
-                        self._reverse_edges[pkg_name].add(name)
-                        break
+                real = normalized.get(dep.lower().replace("-", "_"))
+                # A package listing itself is not a real dependency
+                if real is not None and real != name:
+                    self._edges[name].add(real)
+
+    @cached_property
+    def _reverse_edges(self) -> dict[str, set[str]]:
+        """Map each package to the packages that depend on it, built on first use."""
+        reverse: dict[str, set[str]] = {name: set() for name in self._edges}
+        for name, deps in self._edges.items():
+            for dep in deps:
+                reverse[dep].add(name)
+        return reverse
 
     @property
     def roots(self) -> list[Package]:
@@ -88,16 +110,10 @@ class DependencyGraph:
         Returns:
             List of all packages this package transitively depends on.
         """
-        result: set[str] = set()
-        stack = list(self._edges.get(name, set()))
-
-        while stack:
-            dep = stack.pop()
-            if dep not in result:
-                result.add(dep)
-                stack.extend(self._edges.get(dep, set()))
-
-        return [self.packages[d] for d in result if d in self.packages]
+        deps = self._trans_deps.get(name)
+        if deps is None:
+            deps = self._trans_deps[name] = self._compute_trans(name, self._edges)
+        return [self.packages[d] for d in deps if d in self.packages]
 
     def get_transitive_dependents(self, name: str) -> list[Package]:
         """Get all packages that transitively depend on this package.
@@ -108,18 +124,62 @@ class DependencyGraph:
         Returns:
             List of all packages that transitively depend on this package.
         """
+        dependents = self._trans_dependents.get(name)
+        if dependents is None:
+            dependents = self._trans_dependents[name] = self._compute_trans(
+                name, self._reverse_edges
+            )
+        return [self.packages[d] for d in dependents if d in self.packages]
+
+    @staticmethod
+    def _compute_trans(name: str, edges: dict[str, set[str]]) -> frozenset[str]:
+        """Collect every node reachable from a package along the given edges.
+
+        Args:
+            name: Package name to start from.
+            edges: Adjacency map to walk (forward or reverse edges).
+
+        Returns:
+            Names of all reachable packages.
+        """
         result: set[str] = set()
-        stack = list(self._reverse_edges.get(name, set()))
+        frontier = set(edges.get(name, ()))
+
+        # Expand a whole level at a time; set difference drops visited nodes in C
+        while frontier:
+            result |= frontier
+            following: set[str] = set()
+            for node in frontier:
+                following |= edges.get(node, set())
+            frontier = following - result
+
+        return frozenset(result)
+
+    def get_transitive_dependents_of(self, names: Iterable[str]) -> list[Package]:
+        """Get all packages that transitively depend on any of the given packages.
+
+        The reverse graph is walked once from all seeds together, so each
+        package is visited at most once regardless of how many seeds reach it.
+
+        Args:
+            names: Package names to start from.
+
+        Returns:
+            List of dependent packages, excluding the given packages themselves.
+        """
+        seeds = set(names)
+        visited: set[str] = set()
+        stack = [dep for name in seeds for dep in self._reverse_edges.get(name, ())]
 
         while stack:
             dep = stack.pop()
-            if dep not in result:
-                result.add(dep)
-                stack.extend(self._reverse_edges.get(dep, set()))
+            if dep not in visited:
+                visited.add(dep)
+                stack.extend(self._reverse_edges.get(dep, ()))
 
-        return [self.packages[d] for d in result if d in self.packages]
+        return [self.packages[d] for d in visited - seeds if d in self.packages]
 
-    def get_affected_packages(self, changed: set[str]) -> list[Package]:
+    def get_affected_packages(self, changed: AbstractSet[str]) -> list[Package]:
         """Get all packages affected by changes to the given packages.
 
         This includes the changed packages themselves plus all their
@@ -131,20 +191,22 @@ class DependencyGraph:
         Returns:
             List of all affected packages.
         """
-        affected: set[str] = set(changed)
+        # One walk seeded with every changed package visits each node at most once
+        affected = set(changed) & self.packages.keys()
+        stack = list(affected)
 
-        for name in changed:
-            if name in self.packages:
-                dependents = self.get_transitive_dependents(name)
-                affected.update(p.name for p in dependents)
+        while stack:
+            name = stack.pop()
+            for dependent in self._reverse_edges.get(name, ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
 
-        return [self.packages[n] for n in affected if n in self.packages]
+        return [self.packages[n] for n in affected]
 
-    def topological_order(self) -> Iterator[Package]:
-        """Iterate packages in topological order (dependencies first).
-
-        Yields:
-            Packages in dependency order.
+    @cached_property
+    def _layers(self) -> tuple[tuple[str, ...], ...]:
+        """Topological waves of package names, computed once.
 
         Raises:
             CyclicDependencyError: If a cycle is detected.
@@ -161,10 +223,26 @@ class DependencyGraph:
             cycle = list(e.args[1]) if len(e.args) > 1 else []
             raise CyclicDependencyError(cycle) from e
 
+        layers: list[tuple[str, ...]] = []
         while sorter.is_active():
-            for name in sorter.get_ready():
+            ready = sorter.get_ready()
+            if ready:
+                layers.append(ready)
+                sorter.done(*ready)
+        return tuple(layers)
+
+    def topological_order(self) -> Iterator[Package]:
+        """Iterate packages in topological order (dependencies first).
+
+        Yields:
+            Packages in dependency order.
+
+        Raises:
+            CyclicDependencyError: If a cycle is detected.
+        """
+        for layer in self._layers:
+            for name in layer:
                 yield self.packages[name]
-                sorter.done(name)
 
     def parallel_batches(self) -> Iterator[list[Package]]:
         """Iterate packages in batches that can be executed in parallel.
@@ -178,23 +256,8 @@ class DependencyGraph:
         Raises:
             CyclicDependencyError: If a cycle is detected.
         """
-        sorter: TopologicalSorter[str] = TopologicalSorter()
-
-        for name, deps in self._edges.items():
-            sorter.add(name, *deps)
-
-        try:
-            sorter.prepare()
-        except CycleError as e:
-            cycle = list(e.args[1]) if len(e.args) > 1 else []
-            raise CyclicDependencyError(cycle) from e
-
-        while sorter.is_active():
-            ready = list(sorter.get_ready())
-            if ready:
-                yield [self.packages[name] for name in ready]
-                for name in ready:
-                    sorter.done(name)
+        for layer in self._layers:
+            yield [self.packages[name] for name in layer]
 
     def reverse_topological_order(self) -> Iterator[Package]:
         """Iterate packages in reverse topological order (dependents first).
@@ -205,11 +268,11 @@ class DependencyGraph:
         Yields:
             Packages in reverse dependency order.
         """
-        # Collect in list and reverse
-        ordered = list(self.topological_order())
-        yield from reversed(ordered)
+        for layer in reversed(self._layers):
+            for name in reversed(layer):
+                yield self.packages[name]
 
-    def subgraph(self, names: set[str]) -> DependencyGraph:
+    def subgraph(self, names: AbstractSet[str]) -> DependencyGraph:
         """Create a subgraph containing only the specified packages.
 
         Args:
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
+import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from pymelos.compat import tomllib
 from pymelos.errors import ConfigurationError
@@ -22,6 +28,7 @@ class Package:
         dev_dependencies: Set of dev dependency package names.
         workspace_dependencies: Set of local workspace package names this depends on.
         scripts: Package-level scripts from pyproject.toml.
+        normalized_name: Lowercased name with dashes replaced by underscores.
     """
 
     name: str
@@ -32,6 +39,11 @@ class Package:
     dev_dependencies: frozenset[str] = field(default_factory=frozenset)
     workspace_dependencies: frozenset[str] = field(default_factory=frozenset)
     scripts: dict[str, str] = field(default_factory=dict)
+    normalized_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute derived fields (slotted dataclasses cannot use cached_property)."""
+        object.__setattr__(self, "normalized_name", self.name.lower().replace("-", "_"))
 
     @property
     def pyproject_path(self) -> Path:
@@ -57,6 +69,11 @@ class Package:
         return other.name in self.workspace_dependencies
 
 
+# Leading distribution name of a PEP 508 requirement
+_DEP_NAME_PATTERN = re.compile(r"\s*([A-Za-z0-9_.-]+)")
+
+
+@lru_cache(maxsize=4096)
 def parse_dependency_name(dep: str) -> str:
     """Extract package name from a dependency specifier.
 
@@ -65,32 +82,69 @@ def parse_dependency_name(dep: str) -> str:
         "numpy[extra]" -> "numpy"
         "my-pkg @ file://..." -> "my-pkg"
     """
-    # Handle URL-based dependencies
-    if " @ " in dep:
-        dep = dep.split(" @ ")[0]
+    # The name ends at the first extras, version, marker or URL character
+    match = _DEP_NAME_PATTERN.match(dep)
+    name = match.group(1) if match else dep.strip()
+    return name.lower().replace("-", "_")
 
-    # Handle extras
-    if "[" in dep:
-        dep = dep.split("[")[0]
 
-    # Handle version specifiers
-    for sep in (">=", "<=", "==", "!=", ">", "<", "~=", ";"):
-        if sep in dep:
-            dep = dep.split(sep)[0]
+# Loaded packages keyed by pyproject path: (mtime_ns, size, workspace names, package)
+_PACKAGE_CACHE: dict[Path, tuple[int, int, frozenset[str], Package]] = {}
 
-    return dep.strip().lower().replace("-", "_")
+# Files modified this recently are not cached: filesystem timestamps are coarse,
+# so a same-size rewrite within one tick would otherwise go unnoticed
+_RACY_WINDOW_NS = 100_000_000
 
 
-def load_package(path: Path, workspace_packages: set[str] | None = None) -> Package:
-    """Load a package from its directory.
+def _is_racy(st: os.stat_result) -> bool:
+    """Check whether a file changed too recently for its stat to be trusted."""
+    return time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+
+
+@lru_cache(maxsize=512)
+def _load_toml(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a TOML file, memoized on its path, modification time and size.
+
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        path_str: Path to the TOML file.
+        mtime_ns: Modification time of the file, so edits invalidate the entry.
+        size: File size, catching edits within the same mtime tick.
+
+    Returns:
+        Parsed TOML data.
+    """
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+def _read_pyproject(pyproject_path: Path) -> dict[str, Any]:
+    """Read a pyproject.toml through the parse cache."""
+    st = os.stat(pyproject_path)
+    if _is_racy(st):
+        return _load_toml.__wrapped__(str(pyproject_path), st.st_mtime_ns, st.st_size)
+    return _load_toml(str(pyproject_path), st.st_mtime_ns, st.st_size)
+
+
+def clear_package_cache() -> None:
+    """Drop all cached pyproject.toml data and loaded packages.
+
+    Entries are already invalidated when a file's mtime or size changes; call
+    this to force a full re-read, e.g. after edits that preserve both.
+    """
+    _PACKAGE_CACHE.clear()
+    _load_toml.cache_clear()
+
+
+def read_package_data(path: Path) -> dict[str, Any]:
+    """Read and parse a package's pyproject.toml.
 
     Args:
         path: Path to the package directory.
-        workspace_packages: Set of known workspace package names for detecting
-            local dependencies.
 
     Returns:
-        Package instance with metadata from pyproject.toml.
+        Parsed pyproject.toml data. The dict is shared and must not be mutated.
 
     Raises:
         ConfigurationError: If pyproject.toml is missing or invalid.
@@ -103,14 +157,77 @@ def load_package(path: Path, workspace_packages: set[str] | None = None) -> Pack
         )
 
     try:
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        return _read_pyproject(pyproject_path)
     except tomllib.TOMLDecodeError as e:
         raise ConfigurationError(
             f"Invalid pyproject.toml: {e}",
             path=pyproject_path,
         ) from e
 
+
+def load_package(
+    path: Path,
+    workspace_packages: set[str] | None = None,
+    *,
+    resolved: bool = False,
+) -> Package:
+    """Load a package from its directory.
+
+    Args:
+        path: Path to the package directory.
+        workspace_packages: Set of known workspace package names for detecting
+            local dependencies.
+        resolved: Whether path is already resolved, skipping another realpath.
+
+    Returns:
+        Package instance with metadata from pyproject.toml.
+
+    Raises:
+        ConfigurationError: If pyproject.toml is missing or invalid.
+    """
+    # An unchanged file with the same workspace names yields the same package
+    pyproject_path = path.absolute() / "pyproject.toml"
+    try:
+        st = os.stat(pyproject_path)
+    except OSError:
+        st = None
+    names = frozenset(workspace_packages or ())
+    if st is not None:
+        cached = _PACKAGE_CACHE.get(pyproject_path)
+        if cached is not None and cached[:3] == (st.st_mtime_ns, st.st_size, names):
+            return cached[3]
+
+    package = load_package_from_data(
+        path, read_package_data(path), workspace_packages, resolved=resolved
+    )
+    if st is not None and not _is_racy(st):
+        _PACKAGE_CACHE[pyproject_path] = (st.st_mtime_ns, st.st_size, names, package)
+    return package
+
+
+def load_package_from_data(
+    path: Path,
+    data: dict[str, Any],
+    workspace_packages: set[str] | None = None,
+    *,
+    resolved: bool = False,
+) -> Package:
+    """Build a package from already parsed pyproject.toml data.
+
+    Args:
+        path: Path to the package directory.
+        data: Parsed pyproject.toml contents.
+        workspace_packages: Set of known workspace package names for detecting
+            local dependencies.
+        resolved: Whether path is already resolved, skipping another realpath.
+
+    Returns:
+        Package instance with metadata from pyproject.toml.
+
+    Raises:
+        ConfigurationError: If the [project] section or project.name is missing.
+    """
+    pyproject_path = path / "pyproject.toml"
     project = data.get("project", {})
     if not project:
         raise ConfigurationError(
@@ -148,19 +265,18 @@ def load_package(path: Path, workspace_packages: set[str] | None = None) -> Pack
         if isinstance(source, dict) and source.get("workspace"):
             workspace_deps.add(dep_name.lower().replace("-", "_"))
 
-    # Also check if any dependencies match known workspace packages
+    # Also check if any dependencies match known workspace packages; parsed
+    # names are already normalized, so plain set intersections suffice
     if workspace_packages:
-        for dep in dependencies | dev_dependencies:
-            normalized = dep.lower().replace("-", "_")
-            if normalized in workspace_packages:
-                workspace_deps.add(normalized)
+        workspace_deps.update(dependencies & workspace_packages)
+        workspace_deps.update(dev_dependencies & workspace_packages)
 
     # Parse scripts from pyproject.toml
     scripts = project.get("scripts", {})
 
     return Package(
-        name=name,
-        path=path.resolve(),
+        name=sys.intern(name),
+        path=path if resolved else path.resolve(),
         version=version,
         description=description,
         dependencies=dependencies,
@@ -184,8 +300,7 @@ def get_package_name_from_path(path: Path) -> str | None:
         return None
 
     try:
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        data = _read_pyproject(pyproject_path)
         return data.get("project", {}).get("name")
     except (tomllib.TOMLDecodeError, OSError):
         return None
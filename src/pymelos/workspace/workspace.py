@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -10,7 +10,42 @@ from pymelos.config import PyMelosConfig, load_config
 from pymelos.errors import PackageNotFoundError
 from pymelos.workspace.discovery import discover_packages
 from pymelos.workspace.graph import DependencyGraph
-from pymelos.workspace.package import Package
+from pymelos.workspace.package import Package, clear_package_cache
+
+# Characters that make a scope entry a glob rather than a literal name
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True, slots=True)
+class _NameIndex:
+    """Name-only view of the workspace packages for filtering without touching them.
+
+    Attributes:
+        names: Package names in workspace order.
+        positions: Position of each name in ``names``.
+        by_lower: Lowercased name to matching package names.
+        by_normalized: Name with dashes as underscores to matching package names.
+    """
+
+    names: tuple[str, ...]
+    positions: dict[str, int]
+    by_lower: dict[str, list[str]]
+    by_normalized: dict[str, list[str]]
+
+    @classmethod
+    def build(cls, names: tuple[str, ...]) -> _NameIndex:
+        """Index the given package names."""
+        by_lower: dict[str, list[str]] = {}
+        by_normalized: dict[str, list[str]] = {}
+        for name in names:
+            by_lower.setdefault(name.lower(), []).append(name)
+            by_normalized.setdefault(name.replace("-", "_"), []).append(name)
+        return cls(
+            names=names,
+            positions={name: i for i, name in enumerate(names)},
+            by_lower=by_lower,
+            by_normalized=by_normalized,
+        )
 
 
 @dataclass
@@ -21,7 +56,8 @@ class Workspace:
         root: Path to workspace root directory.
         config: Loaded configuration from pymelos.yaml.
         config_path: Path to the pymelos.yaml file.
-        packages: Dictionary mapping package names to Package instances.
+        packages: Dictionary mapping package names to Package instances,
+            ordered by name.
     """
 
     root: Path
@@ -29,6 +65,7 @@ class Workspace:
     config_path: Path
     packages: dict[str, Package] = field(default_factory=dict)
     _graph: DependencyGraph | None = field(default=None, init=False, repr=False)
+    _name_index: _NameIndex | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def discover(cls, start_path: Path | None = None) -> Workspace:
@@ -107,7 +144,7 @@ class Workspace:
         """
         package = self.packages.get(name)
         if package is None:
-            raise PackageNotFoundError(name, list(self.packages.keys()))
+            raise PackageNotFoundError(name, self._get_name_index().names)
         return package
 
     def has_package(self, name: str) -> bool:
@@ -137,15 +174,66 @@ class Workspace:
         Returns:
             List of matching packages.
         """
-        from pymelos.filters import apply_filters
+        from pymelos.filters import apply_filters, parse_scope
+
+        # Literal names are resolved through the name index; only globs need
+        # a pass over every package
+        if names:
+            return apply_filters(self.filter_packages_by_exact_names(names), ignore=ignore)
+        patterns = parse_scope(scope) if scope else []
+        if patterns and not any(_GLOB_CHARS.intersection(p) for p in patterns):
+            return apply_filters(self._filter_by_literal_scope(patterns), ignore=ignore)
 
         return apply_filters(
             packages=list(self.packages.values()),
             scope=scope,
             ignore=ignore,
-            names=names,
         )
 
+    def filter_packages_by_exact_names(self, names: Iterable[str]) -> list[Package]:
+        """Select packages whose names are exactly among the given names.
+
+        Args:
+            names: Package names; unknown names are ignored.
+
+        Returns:
+            Matching packages in workspace order.
+        """
+        index = self._get_name_index()
+        selected = frozenset(names).intersection(index.positions)
+        return self._in_workspace_order(selected)
+
+    def _filter_by_literal_scope(self, patterns: list[str]) -> list[Package]:
+        """Select packages matching glob-free scope entries.
+
+        Mirrors match_scope for literal patterns: a name matches when it
+        equals the pattern case-insensitively or after mapping dashes to
+        underscores.
+        """
+        index = self._get_name_index()
+        selected: set[str] = set()
+        for pattern in patterns:
+            selected.update(index.by_lower.get(pattern.lower(), ()))
+            selected.update(index.by_normalized.get(pattern.replace("-", "_"), ()))
+        return self._in_workspace_order(selected)
+
+    def _in_workspace_order(self, selected: Iterable[str]) -> list[Package]:
+        """Look up selected package names, keeping workspace order."""
+        positions = self._get_name_index().positions
+        return [self.packages[name] for name in sorted(selected, key=positions.__getitem__)]
+
+    def _get_name_index(self) -> _NameIndex:
+        """Get the name index, rebuilding it if the package names have changed.
+
+        The index is checked against the current names on every call, so
+        reassigning or mutating ``packages`` never leaves it stale.
+        """
+        names = tuple(self.packages)
+        index = self._name_index
+        if index is None or index.names != names:
+            index = self._name_index = _NameIndex.build(names)
+        return index
+
     def topological_order(
         self,
         packages: list[Package] | None = None,
@@ -158,12 +246,7 @@ class Workspace:
         Yields:
             Packages in topological order.
         """
-        if packages is None:
-            yield from self.graph.topological_order()
-        else:
-            names = {p.name for p in packages}
-            subgraph = self.graph.subgraph(names)
-            yield from subgraph.topological_order()
+        yield from self._graph_for(packages).topological_order()
 
     def parallel_batches(
         self,
@@ -177,12 +260,26 @@ class Workspace:
         Yields:
             Batches of packages that can run in parallel.
         """
+        yield from self._graph_for(packages).parallel_batches()
+
+    def _graph_for(self, packages: list[Package] | None) -> DependencyGraph:
+        """Get the graph restricted to the given packages.
+
+        A selection covering the whole workspace uses the full graph, so its
+        cached ordering is reused instead of building an identical subgraph.
+
+        Args:
+            packages: Subset of packages, or None for all.
+
+        Returns:
+            The full graph or a subgraph of the selected packages.
+        """
         if packages is None:
-            yield from self.graph.parallel_batches()
-        else:
-            names = {p.name for p in packages}
-            subgraph = self.graph.subgraph(names)
-            yield from subgraph.parallel_batches()
+            return self.graph
+        names = frozenset(p.name for p in packages)
+        if len(names) == len(self.packages) and names >= self.packages.keys():
+            return self.graph
+        return self.graph.subgraph(names)
 
     def get_affected_packages(self, changed: list[Package]) -> list[Package]:
         """Get all packages affected by changes to given packages.
@@ -193,17 +290,24 @@ class Workspace:
         Returns:
             All affected packages including transitive dependents.
         """
-        changed_names = {p.name for p in changed}
+        changed_names = frozenset(p.name for p in changed)
         affected = self.graph.get_affected_packages(changed_names)
         return list(affected)
 
-    def refresh(self) -> None:
+    def refresh(self, *, clear_cache: bool = False) -> None:
         """Reload packages from disk.
 
-        Call this after making changes to pyproject.toml files.
+        Call this after making changes to pyproject.toml files. A pyproject.toml
+        that is unchanged (same mtime and size) is not parsed again.
+
+        Args:
+            clear_cache: Drop cached package data first and re-read every file.
         """
+        if clear_cache:
+            clear_package_cache()
         self.packages = discover_packages(self.root, self.config)
         self._graph = None
+        self._name_index = None
 
     def __len__(self) -> int:
         """Number of packages in workspace."""
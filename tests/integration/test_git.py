@@ -55,6 +55,23 @@ class TestGitRepo:
 
         assert is_git_repo(tmp_path) is False
 
+    def test_is_git_repo_subdirectory(self, git_repo: Path) -> None:
+        """is_git_repo finds the repository from a subdirectory."""
+        from pymelos.git.repo import is_git_repo
+
+        subdir = git_repo / "packages" / "pkg"
+        subdir.mkdir(parents=True)
+        assert is_git_repo(subdir) is True
+        assert is_git_repo(subdir, strict=True) is True
+
+    def test_is_git_repo_missing_path(self, git_repo: Path) -> None:
+        """is_git_repo returns False for a nonexistent path inside a repository."""
+        from pymelos.git.repo import is_git_repo
+
+        missing = git_repo / "does-not-exist"
+        assert is_git_repo(missing) is False
+        assert is_git_repo(missing, strict=True) is False
+
     def test_get_repo_root(self, git_repo: Path) -> None:
         """get_repo_root returns repository root."""
         from pymelos.git.repo import get_repo_root
@@ -91,6 +108,27 @@ class TestGitRepo:
         assert len(sha) == 40  # Full SHA
         assert all(c in "0123456789abcdef" for c in sha)
 
+    def test_get_repo_snapshot(self, git_repo: Path) -> None:
+        """get_repo_snapshot matches the individual queries."""
+        import asyncio
+
+        from pymelos.git.repo import (
+            get_current_branch,
+            get_current_commit,
+            get_default_branch,
+            get_repo_snapshot,
+            get_repo_snapshot_async,
+        )
+
+        (git_repo / "README.md").write_text("# Modified")
+
+        snapshot = get_repo_snapshot(git_repo)
+        assert snapshot.branch == get_current_branch(git_repo)
+        assert snapshot.head == get_current_commit(git_repo)
+        assert snapshot.is_clean is False
+        assert snapshot.default_branch == get_default_branch(git_repo)
+        assert asyncio.run(get_repo_snapshot_async(git_repo)) == snapshot
+
     def test_is_clean_true(self, git_repo: Path) -> None:
         """is_clean returns True for clean repo."""
         from pymelos.git.repo import is_clean
@@ -132,6 +170,56 @@ class TestGitRepo:
         with pytest.raises(GitError):
             run_git_command(["checkout", "nonexistent-branch"], cwd=git_repo)
 
+    def test_run_git_command_quiet(self, git_repo: Path) -> None:
+        """run_git_command_quiet returns the exit code without raising."""
+        from pymelos.git.repo import run_git_command_quiet
+
+        assert run_git_command_quiet(["rev-parse", "HEAD"], cwd=git_repo) == 0
+        assert run_git_command_quiet(["checkout", "nonexistent-branch"], cwd=git_repo) != 0
+
+    def test_batch_session_resolve(self, git_repo: Path) -> None:
+        """Batch sessions resolve refs, including tags created inside them."""
+        from pymelos.git.repo import GitBatchSession, get_current_commit
+        from pymelos.git.tags import create_tag
+
+        sha = get_current_commit(git_repo)
+
+        with GitBatchSession(git_repo) as session:
+            assert get_current_commit(git_repo) == sha
+            assert session.resolve("nonexistent") is None
+            tag = create_tag(git_repo, "v1.0.0", message="Release")
+
+        assert tag.sha == sha
+
+    def test_run_git_command_stream(self, git_repo: Path) -> None:
+        """run_git_command_stream yields separator-delimited records."""
+        from pymelos.git.repo import run_git_command_stream
+
+        run_git(["commit", "--allow-empty", "-m", "second"], git_repo)
+
+        records = list(
+            run_git_command_stream(["log", "--format=%s%x1e"], cwd=git_repo, separator="\x1e")
+        )
+        assert [r.strip() for r in records if r.strip()] == ["second", "feat: initial commit"]
+
+    def test_run_git_command_stream_failure(self, git_repo: Path) -> None:
+        """run_git_command_stream raises GitError once output is exhausted."""
+        from pymelos.errors import GitError
+        from pymelos.git.repo import run_git_command_stream
+
+        with pytest.raises(GitError):
+            list(run_git_command_stream(["log", "nonexistent-ref"], cwd=git_repo, separator="\n"))
+
+    def test_run_git_command_stream_large_stderr(self, git_repo: Path) -> None:
+        """run_git_command_stream doesn't block on stderr larger than a pipe buffer."""
+        from pymelos.git.repo import run_git_command_stream
+
+        noisy = "alias.noisy=!head -c 1000000 /dev/zero >&2; echo done"
+        records = run_git_command_stream(
+            ["-c", noisy, "noisy"], cwd=git_repo, separator="\n", check=False
+        )
+        assert list(records) == ["done", ""]
+
 
 class TestGitCommits:
     """Tests for git/commits.py functions."""
@@ -223,6 +311,123 @@ class TestGitCommits:
         assert len(commits) == 1
         assert commits[0].subject == "feat: add foo package"
 
+    def test_get_commits_for_paths(self, git_repo: Path) -> None:
+        """get_commits_for_paths matches per-path get_commits results."""
+        from pymelos.git.commits import get_commits, get_commits_for_paths
+
+        foo = git_repo / "packages" / "foo"
+        bar = git_repo / "packages" / "bar"
+        foo.mkdir(parents=True)
+        bar.mkdir(parents=True)
+        (foo / "file.txt").write_text("content")
+        (bar / "file.txt").write_text("content")
+        run_git(["add", "."], git_repo)
+        run_git(["commit", "-m", "feat: add packages"], git_repo)
+        run_git(["tag", "foo@1.0.0"], git_repo)
+
+        (foo / "file.txt").write_text("changed")
+        run_git(["commit", "-am", "fix: change foo"], git_repo)
+        run_git(["tag", "bar@1.0.0"], git_repo)
+
+        (bar / "file.txt").write_text("changed")
+        (foo / "other.txt").write_text("new")
+        run_git(["add", "."], git_repo)
+        run_git(["commit", "-m", "feat: change both"], git_repo)
+
+        targets = {
+            "foo": (foo, "foo@1.0.0"),
+            "bar": (bar, "bar@1.0.0"),
+            "all-foo": (foo, None),
+        }
+        result = get_commits_for_paths(git_repo, targets)
+
+        for key, (path, since) in targets.items():
+            expected = get_commits(git_repo, since=since, path=path)
+            assert [c.sha for c in result[key]] == [c.sha for c in expected]
+        assert [c.subject for c in result["foo"]] == ["feat: change both", "fix: change foo"]
+        assert [c.subject for c in result["bar"]] == ["feat: change both"]
+
+    def test_get_commits_for_paths_off_head_tag(self, git_repo: Path) -> None:
+        """A since tag not reachable from HEAD matches per-path get_commits."""
+        from pymelos.git.commits import get_commits, get_commits_for_paths
+
+        foo = git_repo / "packages" / "foo"
+        bar = git_repo / "packages" / "bar"
+        foo.mkdir(parents=True)
+        bar.mkdir(parents=True)
+        (foo / "file.txt").write_text("content")
+        (bar / "file.txt").write_text("content")
+        run_git(["add", "."], git_repo)
+        run_git(["commit", "-m", "feat: add packages"], git_repo)
+        run_git(["tag", "bar@0.1.0"], git_repo)
+        main = run_git(["rev-parse", "--abbrev-ref", "HEAD"], git_repo).stdout.strip()
+
+        (foo / "file.txt").write_text("A")
+        run_git(["commit", "-am", "fix: foo A"], git_repo)
+
+        # Release foo from a side branch, then keep working on main
+        run_git(["checkout", "-b", "rel"], git_repo)
+        (foo / "release.txt").write_text("release")
+        run_git(["add", "."], git_repo)
+        run_git(["commit", "-m", "chore: foo release"], git_repo)
+        run_git(["tag", "foo@1.0.0"], git_repo)
+        run_git(["checkout", main], git_repo)
+
+        (foo / "file.txt").write_text("main")
+        run_git(["commit", "-am", "feat: foo main"], git_repo)
+
+        targets = {"foo": (foo, "foo@1.0.0"), "bar": (bar, "bar@0.1.0")}
+        result = get_commits_for_paths(git_repo, targets)
+
+        for key, (path, since) in targets.items():
+            expected = get_commits(git_repo, since=since, path=path)
+            assert [c.sha for c in result[key]] == [c.sha for c in expected]
+        assert [c.subject for c in result["foo"]] == ["feat: foo main"]
+
+    def test_get_commits_for_paths_merge_commits(self, git_repo: Path) -> None:
+        """Merges are kept for a path exactly when per-path get_commits keeps them."""
+        from pymelos.git.commits import get_commits, get_commits_for_paths
+
+        foo = git_repo / "packages" / "foo"
+        bar = git_repo / "packages" / "bar"
+        foo.mkdir(parents=True)
+        bar.mkdir(parents=True)
+        (foo / "x.txt").write_text("x")
+        (foo / "y.txt").write_text("y")
+        (bar / "z.txt").write_text("z")
+        run_git(["add", "."], git_repo)
+        run_git(["commit", "-m", "feat: add packages"], git_repo)
+        run_git(["tag", "v0"], git_repo)
+        main = run_git(["rev-parse", "--abbrev-ref", "HEAD"], git_repo).stdout.strip()
+
+        # Both sides change foo, so the merge differs from each parent there
+        run_git(["checkout", "-b", "side"], git_repo)
+        (foo / "x.txt").write_text("side")
+        (bar / "z.txt").write_text("side")
+        run_git(["commit", "-am", "fix: side"], git_repo)
+        run_git(["checkout", main], git_repo)
+        (foo / "y.txt").write_text("main")
+        run_git(["commit", "-am", "fix: main"], git_repo)
+        run_git(["merge", "--no-ff", "side", "-m", "feat: merged PR (#1)"], git_repo)
+
+        targets = {
+            "foo": (foo, "v0"),
+            "bar": (bar, "v0"),
+            "root": (git_repo, "v0"),
+            "all": (foo, None),
+        }
+        result = get_commits_for_paths(git_repo, targets)
+
+        for key, (path, since) in targets.items():
+            expected = get_commits(git_repo, since=since, path=path)
+            assert [c.sha for c in result[key]] == [c.sha for c in expected]
+        assert [c.subject for c in result["foo"]] == [
+            "feat: merged PR (#1)",
+            "fix: main",
+            "fix: side",
+        ]
+        assert [c.subject for c in result["bar"]] == ["fix: side"]
+
     def test_get_commit(self, git_repo: Path) -> None:
         """get_commit returns single commit."""
         from pymelos.git.commits import get_commit
@@ -234,6 +439,7 @@ class TestGitCommits:
         assert commit is not None
         assert commit.sha == sha
         assert commit.subject == "feat: initial commit"
+        assert commit.short_sha == sha[:7]
 
     def test_get_commit_not_found(self, git_repo: Path) -> None:
         """get_commit returns None for invalid ref."""
@@ -256,6 +462,26 @@ class TestGitCommits:
         assert len(commits) == 1
         assert commits[0].subject == "feat: add module"
 
+    def test_get_commit_in_batch_session(self, git_repo: Path) -> None:
+        """get_commit reads through an active batch session identically."""
+        from pymelos.git.commits import get_commit
+        from pymelos.git.repo import GitBatchSession
+
+        run_git(
+            ["commit", "--allow-empty", "-m", "feat: add\nmore", "-m", "Body.\n\nFooter: x"],
+            git_repo,
+        )
+        refs = ["HEAD", "HEAD~1", "nonexistent"]
+        expected = [get_commit(git_repo, ref) for ref in refs]
+
+        with GitBatchSession(git_repo):
+            actual = [get_commit(git_repo, ref) for ref in refs]
+
+        assert actual == expected
+        assert actual[0] is not None
+        assert actual[0].subject == "feat: add more"
+        assert actual[2] is None
+
     def test_commit_subject_and_body(self, git_repo: Path) -> None:
         """Commit subject and body properties work correctly."""
         from pymelos.git.commits import get_commits
@@ -331,6 +557,61 @@ class TestGitTags:
         assert tag.name == "v1.0.0"
         assert tag.is_annotated is True
 
+    def test_create_tags(self, git_repo: Path) -> None:
+        """create_tags writes tags equivalent to git tag."""
+        from pymelos.git.repo import get_current_commit
+        from pymelos.git.tags import TagSpec, create_tags, get_tags_for_commit
+
+        sha = get_current_commit(git_repo)
+        tags = create_tags(
+            git_repo,
+            [
+                TagSpec("core@1.0.0", message="Release core@1.0.0"),
+                TagSpec("api@1.0.0", commit=sha),
+            ],
+        )
+
+        assert [(t.name, t.sha, t.is_annotated) for t in tags] == [
+            ("core@1.0.0", sha, True),
+            ("api@1.0.0", sha, False),
+        ]
+        found = {t.name: t.is_annotated for t in get_tags_for_commit(git_repo, sha)}
+        assert found == {"core@1.0.0": True, "api@1.0.0": False}
+
+    def test_create_tags_stops_at_first_failure(self, git_repo: Path) -> None:
+        """create_tags keeps tags created before a failing one."""
+        from pymelos.errors import GitError
+        from pymelos.git.tags import TagSpec, create_tags, list_tags
+
+        run_git(["tag", "api@1.0.0"], git_repo)
+
+        with pytest.raises(GitError):
+            create_tags(
+                git_repo,
+                [
+                    TagSpec("core@1.0.0", message="Release"),
+                    TagSpec("api@1.0.0", message="Release"),
+                    TagSpec("web@1.0.0", message="Release"),
+                ],
+            )
+
+        assert [t.name for t in list_tags(git_repo)] == ["api@1.0.0", "core@1.0.0"]
+
+    def test_create_tags_lightweight_is_atomic(self, git_repo: Path) -> None:
+        """create_tags writes lightweight tags all at once or not at all."""
+        from pymelos.errors import GitError
+        from pymelos.git.tags import TagSpec, create_tags, list_tags
+
+        run_git(["tag", "api@1.0.0"], git_repo)
+
+        with pytest.raises(GitError):
+            create_tags(
+                git_repo,
+                [TagSpec("core@1.0.0"), TagSpec("api@1.0.0"), TagSpec("web@1.0.0")],
+            )
+
+        assert [t.name for t in list_tags(git_repo)] == ["api@1.0.0"]
+
     def test_delete_tag(self, git_repo: Path) -> None:
         """delete_tag removes a tag."""
         from pymelos.git.tags import create_tag, delete_tag, list_tags
@@ -368,6 +649,21 @@ class TestGitTags:
         assert latest is not None
         assert latest.name == "v1.0.0"
 
+    def test_get_latest_tag_annotated_resolves_commit(self, git_repo: Path) -> None:
+        """get_latest_tag reports the commit behind an annotated tag."""
+        from pymelos.git.repo import get_current_commit
+        from pymelos.git.tags import create_tag, get_latest_tag
+
+        sha = get_current_commit(git_repo)
+        tag = create_tag(git_repo, "pkg@1.0.0", message="Release pkg@1.0.0", commit=sha)
+        assert tag.sha == sha
+
+        latest = get_latest_tag(git_repo, prefix="pkg@")
+        assert latest is not None
+        assert latest.name == "pkg@1.0.0"
+        assert latest.sha == sha
+        assert latest.is_annotated is True
+
     def test_get_latest_tag_none(self, git_repo: Path) -> None:
         """get_latest_tag returns None when no tags."""
         from pymelos.git.tags import get_latest_tag
@@ -382,13 +678,15 @@ class TestGitTags:
 
         sha = get_current_commit(git_repo)
         create_tag(git_repo, "v1.0.0")
-        create_tag(git_repo, "release-1.0")
+        create_tag(git_repo, "release-1.0", message="Release 1.0")
 
         tags = get_tags_for_commit(git_repo, sha)
         assert len(tags) == 2
         tag_names = [t.name for t in tags]
         assert "v1.0.0" in tag_names
         assert "release-1.0" in tag_names
+        annotated = {t.name: t.is_annotated for t in tags}
+        assert annotated == {"v1.0.0": False, "release-1.0": True}
 
     def test_parse_version_from_tag(self) -> None:
         """parse_version_from_tag extracts version."""
@@ -426,6 +724,23 @@ class TestGitTags:
         assert "core@1.0.0" in tag_names
         assert "core@1.1.0" in tag_names
 
+    def test_list_all_tags_grouped(self, git_repo: Path) -> None:
+        """list_all_tags_grouped buckets package tags by name."""
+        from pymelos.git.tags import list_all_tags_grouped
+
+        run_git(["tag", "core@1.0.0"], git_repo)
+        run_git(["tag", "api@1.0.0"], git_repo)
+        run_git(["tag", "v1.0.0"], git_repo)
+
+        grouped = list_all_tags_grouped(git_repo)
+        assert sorted(grouped) == ["api", "core"]
+        assert [t.name for t in grouped["core"]] == ["core@1.0.0"]
+
+        # Tags created outside pymelos show up on the next call
+        run_git(["tag", "core@1.1.0"], git_repo)
+        grouped = list_all_tags_grouped(git_repo)
+        assert [t.name for t in grouped["core"]] == ["core@1.0.0", "core@1.1.0"]
+
     def test_get_latest_package_tag(self, git_repo: Path) -> None:
         """get_latest_package_tag returns latest version."""
         from pymelos.git.tags import create_tag, get_latest_package_tag
@@ -438,6 +753,22 @@ class TestGitTags:
         assert latest is not None
         assert latest.name == "core@1.1.0"
 
+    def test_get_latest_package_tags(self, git_repo: Path) -> None:
+        """get_latest_package_tags returns the latest tag per package."""
+        from pymelos.git.tags import create_tag, get_latest_package_tags
+
+        create_tag(git_repo, "core@1.0.0")
+        create_tag(git_repo, "core@1.10.0")
+        create_tag(git_repo, "core@1.9.0")
+        create_tag(git_repo, "api@2.0.0")
+
+        latest = get_latest_package_tags(git_repo, ["core", "api", "cli"])
+        assert latest["core"] is not None
+        assert latest["core"].name == "core@1.10.0"
+        assert latest["api"] is not None
+        assert latest["api"].name == "api@2.0.0"
+        assert latest["cli"] is None
+
     def test_get_latest_package_tag_none(self, git_repo: Path) -> None:
         """get_latest_package_tag returns None when no tags."""
         from pymelos.git.tags import get_latest_package_tag
@@ -517,6 +848,36 @@ class TestGitChanges:
         changed = get_changed_files_since(git_repo, initial_sha, include_untracked=False)
         assert Path("untracked.txt") not in changed
 
+    def test_get_changed_paths_since(self, git_repo: Path) -> None:
+        """get_changed_paths_since returns POSIX path strings."""
+        from pymelos.git.changes import get_changed_paths_since
+        from pymelos.git.repo import get_current_commit
+
+        initial_sha = get_current_commit(git_repo)
+
+        (git_repo / "sub").mkdir()
+        (git_repo / "sub" / "file.txt").write_text("content")
+        run_git(["add", "sub/file.txt"], git_repo)
+        run_git(["commit", "-m", "feat: add sub file"], git_repo)
+        (git_repo / "README.md").write_text("modified")
+
+        changed = get_changed_paths_since(git_repo, initial_sha)
+        assert changed == {"sub/file.txt", "README.md"}
+
+    def test_get_changed_paths_since_unusual_names(self, git_repo: Path) -> None:
+        """File names git would quote are returned verbatim."""
+        from pymelos.git.changes import get_changed_paths_since
+        from pymelos.git.repo import get_current_commit
+
+        initial_sha = get_current_commit(git_repo)
+
+        (git_repo / "café notes.txt").write_text("content")
+        run_git(["add", "."], git_repo)
+        run_git(["commit", "-m", "docs: add notes"], git_repo)
+
+        changed = get_changed_paths_since(git_repo, initial_sha)
+        assert changed == {"café notes.txt"}
+
     def test_get_files_in_commit(self, git_repo: Path) -> None:
         """get_files_in_commit returns files changed in commit."""
         from pymelos.git.changes import get_files_in_commit
@@ -553,6 +914,40 @@ class TestGitChanges:
         commits = get_commits_since(git_repo, initial_sha)
         assert len(commits) == 2
 
+    def test_get_commits_since_head(self, git_repo: Path) -> None:
+        """get_commits_since HEAD is empty."""
+        from pymelos.git.changes import get_commits_since
+
+        assert get_commits_since(git_repo, "HEAD") == []
+
+    def test_get_commits_since_ref_at_head(
+        self, git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_commits_since skips git log for refs that resolve to HEAD."""
+        from pymelos.git import changes
+        from pymelos.git.repo import get_current_commit
+
+        run_git(["tag", "core@1.0.0"], git_repo)
+        calls: list[list[str]] = []
+        run = changes.run_git_command
+
+        def recording_run(args: list[str], **kwargs: object) -> object:
+            calls.append(args)
+            return run(args, **kwargs)
+
+        monkeypatch.setattr(changes, "run_git_command", recording_run)
+
+        assert changes.get_commits_since(git_repo, get_current_commit(git_repo)) == []
+        assert changes.get_commits_since(git_repo, "core@1.0.0") == []
+        assert not any(args[0] == "log" for args in calls)
+
+        (git_repo / "file1.txt").write_text("content1")
+        run_git(["add", "file1.txt"], git_repo)
+        run_git(["commit", "-m", "feat: commit 1"], git_repo)
+
+        # HEAD moved without telling pymelos; the new commit must still show
+        assert len(changes.get_commits_since(git_repo, "core@1.0.0")) == 1
+
     def test_get_commits_since_with_path(self, git_repo: Path) -> None:
         """get_commits_since filters by path."""
         from pymelos.git.changes import get_commits_since
@@ -597,6 +992,37 @@ class TestGitChanges:
         # Current is not ancestor of initial
         assert is_ancestor(git_repo, initial_sha, current_sha) is False
 
+    def test_ref_lookups_uncached_outside_scope(self, git_repo: Path) -> None:
+        """Ref lookups outside a ref_cache_scope see refs moved by anyone."""
+        from pymelos.git.changes import get_merge_base
+        from pymelos.git.repo import get_current_commit
+
+        initial_sha = get_current_commit(git_repo)
+        assert get_merge_base(git_repo, "HEAD", "HEAD") == initial_sha
+
+        (git_repo / "file.txt").write_text("content")
+        run_git(["add", "file.txt"], git_repo)
+        run_git(["commit", "-m", "feat: add file"], git_repo)
+
+        assert get_merge_base(git_repo, "HEAD", "HEAD") == get_current_commit(git_repo)
+
+    def test_ref_cache_scope(self, git_repo: Path) -> None:
+        """Ref lookups are memoized within a scope until clear_ref_cache."""
+        from pymelos.git.changes import clear_ref_cache, get_merge_base, ref_cache_scope
+        from pymelos.git.repo import get_current_commit
+
+        initial_sha = get_current_commit(git_repo)
+        with ref_cache_scope():
+            assert get_merge_base(git_repo, "HEAD", "HEAD") == initial_sha
+
+            (git_repo / "file.txt").write_text("content")
+            run_git(["add", "file.txt"], git_repo)
+            run_git(["commit", "-m", "feat: add file"], git_repo)
+            assert get_merge_base(git_repo, "HEAD", "HEAD") == initial_sha
+
+            clear_ref_cache()
+            assert get_merge_base(git_repo, "HEAD", "HEAD") == get_current_commit(git_repo)
+
     def test_get_merge_base(self, git_repo: Path) -> None:
         """get_merge_base returns common ancestor."""
         from pymelos.git.changes import get_merge_base
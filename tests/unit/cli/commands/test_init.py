@@ -127,6 +127,7 @@ class TestInitWorkspace:
         content = (temp_dir / "pymelos.yaml").read_text()
         assert "versioning:" in content
         assert "commit_format: conventional" in content
+        assert 'tag_format: "{name}@{version}"' in content
         assert "changelog:" in content
 
     def test_scripts_config_in_pymelos_yaml(self, temp_dir: Path) -> None:
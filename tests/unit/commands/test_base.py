@@ -0,0 +1,38 @@
+"""Tests for command base classes."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from pymelos.commands.base import Command, CommandContext, SyncCommand
+from pymelos.git.changes import _ref_cache
+from pymelos.workspace.workspace import Workspace
+
+
+class _SyncProbe(SyncCommand[bool]):
+    def execute(self) -> bool:
+        return _ref_cache.get() is not None
+
+
+class _AsyncProbe(Command[bool]):
+    async def execute(self) -> bool:
+        return _ref_cache.get() is not None
+
+
+class TestRefCacheScope:
+    """Tests for the git ref cache scope around execute()."""
+
+    def test_sync_execute_runs_in_scope(self, workspace_dir: Path) -> None:
+        """SyncCommand.execute memoizes ref lookups only while it runs."""
+        context = CommandContext(workspace=Workspace.discover(workspace_dir))
+
+        assert _SyncProbe(context).execute() is True
+        assert _ref_cache.get() is None
+
+    def test_async_execute_runs_in_scope(self, workspace_dir: Path) -> None:
+        """Command.execute memoizes ref lookups only while it runs."""
+        context = CommandContext(workspace=Workspace.discover(workspace_dir))
+
+        assert asyncio.run(_AsyncProbe(context).execute()) is True
+        assert _ref_cache.get() is None
@@ -47,6 +47,18 @@ class TestChangedCommand:
         assert "pkg-a" in names
         assert "pkg-b" in names
 
+    def test_sorted_when_packages_not_in_name_order(
+        self, git_workspace_with_changes: Path
+    ) -> None:
+        """Should sort by name even if workspace.packages is not in name order."""
+        workspace = Workspace.discover(git_workspace_with_changes)
+        workspace.packages = dict(reversed(workspace.packages.items()))
+        result = get_changed_packages(workspace, "HEAD~1", include_dependents=True)
+
+        names = [p.name for p in result.changed]
+        assert len(names) > 1
+        assert names == sorted(names)
+
     def test_excludes_dependents_when_disabled(
         self, git_workspace_with_changes: Path
     ) -> None:
@@ -216,3 +228,22 @@ class TestChangedEdgeCases:
 
         names = [p.name for p in result.changed]
         assert "pkg-a" in names
+
+    def test_sibling_with_shared_prefix(self, git_workspace: Path) -> None:
+        """Should not attribute files to a package whose path is a name prefix."""
+        pkg_ab = git_workspace / "packages" / "pkg-a-ext"
+        pkg_ab.mkdir()
+        (pkg_ab / "pyproject.toml").write_text(
+            '[project]\nname = "pkg-a-ext"\nversion = "0.1.0"\n'
+        )
+
+        os.system(f"cd {git_workspace} && git add -A && git commit -q -m 'Add pkg-a-ext'")
+
+        (pkg_ab / "new.py").write_text("# pkg-a-ext change")
+        os.system(f"cd {git_workspace} && git add -A && git commit -q -m 'Change pkg-a-ext'")
+
+        workspace = Workspace.discover(git_workspace)
+        result = get_changed_packages(workspace, "HEAD~1", include_dependents=False)
+
+        names = [p.name for p in result.changed]
+        assert names == ["pkg-a-ext"]
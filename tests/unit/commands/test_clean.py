@@ -178,6 +178,16 @@ class TestCleanCommandClass:
         assert cmd.is_protected(Path(".venv"), {".git", ".venv"})
         assert not cmd.is_protected(Path("__pycache__"), {".git", ".venv"})
 
+    def test_is_protected_glob_patterns(self, workspace_dir: Path) -> None:
+        """Protected patterns are globs matched against the full name."""
+        workspace = Workspace.discover(workspace_dir)
+        context = CommandContext(workspace=workspace)
+        cmd = CleanCommand(context)
+
+        assert cmd.is_protected(Path("keep-me.pyc"), {"keep-*"})
+        assert not cmd.is_protected(Path("dont-keep-me.pyc"), {"keep-*"})
+        assert not cmd.is_protected(Path(".git"), set())
+
 
 class TestCleanEdgeCases:
     """Edge case tests for clean command."""
@@ -36,6 +36,14 @@ class TestListCommand:
         names = [p.name for p in result.packages]
         assert names == sorted(names)
 
+    def test_sorted_when_packages_not_in_name_order(self, workspace_dir: Path) -> None:
+        """Should sort by name even if workspace.packages is not in name order."""
+        workspace = Workspace.discover(workspace_dir)
+        workspace.packages = dict(reversed(workspace.packages.items()))
+        result = list_packages(workspace)
+
+        assert [p.name for p in result.packages] == ["pkg-a", "pkg-b", "pkg-c"]
+
     def test_includes_version(self, workspace_dir: Path) -> None:
         """Should include version for each package."""
         workspace = Workspace.discover(workspace_dir)
@@ -328,6 +328,24 @@ class TestReleaseCommandClass:
         assert result is not None
         assert result.bump_type == BumpType.PATCH
 
+    def test_format_tag_default(self, git_workspace: Path) -> None:
+        """Should format tags with the default name@version format."""
+        workspace = Workspace.discover(git_workspace)
+        cmd = ReleaseCommand(CommandContext(workspace=workspace))
+
+        assert cmd._format_tag("pkg-a", "1.2.0") == "pkg-a@1.2.0"
+
+    def test_format_tag_custom(self, git_workspace: Path) -> None:
+        """Should honor a custom tag format."""
+        workspace = Workspace.discover(git_workspace)
+        versioning = workspace.config.versioning.model_copy(
+            update={"tag_format": "{name}-v{version}"}
+        )
+        workspace.config = workspace.config.model_copy(update={"versioning": versioning})
+        cmd = ReleaseCommand(CommandContext(workspace=workspace))
+
+        assert cmd._format_tag("pkg-a", "1.2.0") == "pkg-a-v1.2.0"
+
 
 class TestReleaseEdgeCases:
     """Edge case tests for release command."""
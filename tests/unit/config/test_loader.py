@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -172,6 +175,49 @@ scripts:
         with pytest.raises(ConfigurationError, match="Config file not found"):
             load_config(path=config_path)
 
+    def test_unchanged_config_is_cached(self, tmp_path: Path) -> None:
+        """Reloading an unchanged file returns the cached config."""
+        config_path = tmp_path / "pymelos.yaml"
+        config_path.write_text("name: cached\npackages: ['*']")
+
+        first, _ = load_config(path=config_path)
+        second, _ = load_config(path=config_path)
+        assert second is first
+
+    def test_same_size_change_is_reloaded(self, tmp_path: Path) -> None:
+        """Content changes of the same size are detected by digest."""
+        config_path = tmp_path / "pymelos.yaml"
+        config_path.write_text("name: aaaa\npackages: ['*']")
+        load_config(path=config_path)
+
+        stat = config_path.stat()
+        config_path.write_text("name: bbbb\npackages: ['*']")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        config, _ = load_config(path=config_path)
+        assert config.name == "bbbb"
+
+    def test_modified_config_is_reloaded(self, tmp_path: Path) -> None:
+        """Changing the file invalidates the cached config."""
+        config_path = tmp_path / "pymelos.yaml"
+        config_path.write_text("name: before\npackages: ['*']")
+        first, _ = load_config(path=config_path)
+
+        config_path.write_text("name: after-change\npackages: ['*']")
+        second, _ = load_config(path=config_path)
+        assert second.name == "after-change"
+        assert second is not first
+
+    def test_touched_config_reuses_cache(self, tmp_path: Path) -> None:
+        """A new mtime with identical content reuses the cached config."""
+        config_path = tmp_path / "pymelos.yaml"
+        config_path.write_text("name: touched\npackages: ['*']")
+        first, _ = load_config(path=config_path)
+
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second, _ = load_config(path=config_path)
+        assert second is first
+
 
 class TestGetWorkspaceRoot:
     """Tests for get_workspace_root()."""
@@ -193,3 +239,23 @@ class TestGetWorkspaceRoot:
 
         root = get_workspace_root(config_path)
         assert root == subdir.resolve()
+
+
+class TestLazyImports:
+    """Tests for deferred pydantic imports."""
+
+    def test_cli_import_skips_pydantic(self) -> None:
+        """Importing the CLI does not load the config schema."""
+        code = "import sys, pymelos.cli; print('pydantic' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_config_attributes_resolve(self) -> None:
+        """Config package exports resolve on access."""
+        import pymelos.config
+
+        assert pymelos.config.PyMelosConfig.__name__ == "PyMelosConfig"
+        with pytest.raises(AttributeError):
+            _ = pymelos.config.NotAThing  # type: ignore[attr-defined]
@@ -227,6 +227,15 @@ class TestPyMelosConfig:
         )
         assert set(config.script_names) == {"test", "lint"}
 
+    def test_get_script_returns_stored_config(self) -> None:
+        """get_script returns the normalized ScriptConfig without rebuilding it."""
+        config = PyMelosConfig(
+            name="test",
+            packages=["packages/*"],
+            scripts={"test": "pytest"},
+        )
+        assert config.get_script("test") is config.get_script("test")
+
     def test_full_config(self) -> None:
         """Full configuration with all options."""
         config = PyMelosConfig(
@@ -256,3 +265,23 @@ class TestPyMelosConfig:
         assert config.command_defaults.concurrency == 4
         assert config.clean.patterns is not None
         assert config.versioning.commit_format == CommitFormat.CONVENTIONAL
+
+    def test_config_is_frozen(self) -> None:
+        """Config models reject attribute assignment."""
+        config = PyMelosConfig(name="test", packages=["packages/*"])
+        with pytest.raises(ValidationError):
+            config.name = "changed"  # type: ignore[misc]
+        with pytest.raises(ValidationError):
+            config.command_defaults.concurrency = 2  # type: ignore[misc]
+
+    def test_fast_reload_reuses_validated_config(self) -> None:
+        """fast_reload returns the cached instance for a known content hash."""
+        data = {"name": "test", "packages": ["packages/*"]}
+        first = PyMelosConfig.fast_reload(data, "test-fast-reload-key")
+        second = PyMelosConfig.fast_reload(dict(data), "test-fast-reload-key")
+        assert first is second
+
+    def test_fast_reload_validates_new_content(self) -> None:
+        """fast_reload validates data it has not seen."""
+        with pytest.raises(ValidationError):
+            PyMelosConfig.fast_reload({"name": "test"}, "test-fast-reload-invalid")
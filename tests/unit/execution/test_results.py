@@ -132,6 +132,18 @@ class TestBatchResult:
 
         assert len(batch) == 2
 
+    def test_add_updates_aggregates(self) -> None:
+        """Aggregates reflect results added after construction."""
+        batch = BatchResult(results=[ExecutionResult.success_result("pkg-a")])
+        batch.add(ExecutionResult.failure_result("pkg-b", exit_code=1))
+        batch.add(ExecutionResult.skipped_result("pkg-c"))
+
+        assert batch.success_count == 1
+        assert batch.failure_count == 1
+        assert batch.skipped_count == 1
+        assert batch.failed_packages == ["pkg-b"]
+        assert batch.all_success is False
+
     def test_all_success(self) -> None:
         """all_success is True when all results are successful."""
         batch = BatchResult(
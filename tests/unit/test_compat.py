@@ -0,0 +1,51 @@
+"""Tests for compat module."""
+
+from __future__ import annotations
+
+import io
+import sys
+from types import ModuleType
+
+import pytest
+
+from pymelos.compat import _RtomlAdapter
+
+if sys.version_info >= (3, 11):
+    import tomllib as reference_toml
+else:
+    import tomli as reference_toml
+
+
+class _FakeParsingError(ValueError):
+    """Stand-in for rtoml.TomlParsingError."""
+
+
+def _fake_rtoml() -> ModuleType:
+    """Build a module exposing the rtoml API backed by the stdlib parser."""
+    module = ModuleType("rtoml")
+
+    def loads(s: str) -> dict[str, object]:
+        try:
+            return reference_toml.loads(s)
+        except reference_toml.TOMLDecodeError as e:
+            raise _FakeParsingError(str(e)) from e
+
+    module.loads = loads  # type: ignore[attr-defined]
+    module.TomlParsingError = _FakeParsingError  # type: ignore[attr-defined]
+    return module
+
+
+class TestRtomlAdapter:
+    """Tests for the rtoml tomllib adapter."""
+
+    def test_load_reads_binary_file(self) -> None:
+        """load() accepts a binary file object like tomllib.load."""
+        adapter = _RtomlAdapter(_fake_rtoml())
+        data = adapter.load(io.BytesIO(b'[project]\nname = "pkg"\n'))
+        assert data == {"project": {"name": "pkg"}}
+
+    def test_decode_error_is_exposed(self) -> None:
+        """Parse errors surface as the adapter's TOMLDecodeError."""
+        adapter = _RtomlAdapter(_fake_rtoml())
+        with pytest.raises(adapter.TOMLDecodeError):
+            adapter.loads("invalid [ toml")
@@ -7,6 +7,7 @@ from pymelos.versioning.conventional import (
     filter_commits_by_type,
     group_commits_by_type,
     is_conventional_commit,
+    may_bump_version,
     parse_commit_message,
 )
 from pymelos.versioning.semver import BumpType
@@ -282,3 +283,44 @@ class TestIsConventionalCommit:
         assert not is_conventional_commit("Update README")
         assert not is_conventional_commit("random: not a type")
         assert not is_conventional_commit("")
+
+
+class TestMayBumpVersion:
+    """Tests for may_bump_version()."""
+
+    def test_bumping_types(self) -> None:
+        """Messages with bumping types are candidates."""
+        assert may_bump_version("feat: add feature")
+        assert may_bump_version("fix(core): fix bug")
+        assert may_bump_version("perf: faster")
+        assert may_bump_version("Revert: undo change")
+
+    def test_breaking_changes(self) -> None:
+        """Breaking markers make any type a candidate."""
+        assert may_bump_version("chore!: drop support")
+        assert may_bump_version("refactor(api)!: rename")
+        assert may_bump_version("docs: update\n\nBREAKING CHANGE: new format")
+
+    def test_non_bumping_messages(self) -> None:
+        """Messages that cannot bump are rejected."""
+        assert not may_bump_version("docs: update readme")
+        assert not may_bump_version("chore(deps): bump pydantic")
+        assert not may_bump_version("Merge branch 'main'")
+        assert not may_bump_version("Fix typo")
+
+    def test_agrees_with_parser(self) -> None:
+        """Every message that parses to a bump is a candidate."""
+        messages = [
+            "feat: a",
+            "fix(x): b",
+            "perf: c",
+            "revert: d",
+            "style!: e",
+            "test: f\n\nBREAKING-CHANGE: g",
+            "  feat: leading space",
+        ]
+        for message in messages:
+            parsed = parse_commit_message(message)
+            assert parsed is not None
+            assert parsed.bump_type != BumpType.NONE
+            assert may_bump_version(message)
@@ -91,6 +91,10 @@ class TestVersionParsing:
         with pytest.raises(ValueError):
             Version.parse("01.2.3")
 
+    def test_parse_reuses_instances(self) -> None:
+        """Repeat parses of a version string share one instance."""
+        assert Version.parse("1.2.3-rc.1") is Version.parse("v1.2.3-rc.1")
+
 
 class TestVersionBumping:
     """Tests for Version.bump()."""
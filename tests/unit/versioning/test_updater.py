@@ -0,0 +1,34 @@
+"""Tests for version file updater module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pymelos.versioning.updater import get_pyproject_version
+
+
+class TestGetPyprojectVersion:
+    """Tests for get_pyproject_version()."""
+
+    def test_version_in_project_table(self, tmp_path: Path) -> None:
+        """Read the version from the [project] table."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]  # metadata\nname = "pkg"\nversion = "1.2.3"\n')
+        assert get_pyproject_version(path) == "1.2.3"
+
+    def test_ignores_version_in_other_tables(self, tmp_path: Path) -> None:
+        """A version key in another table is not mistaken for the project version."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text(
+            '[tool.other]\nversion = "9.9.9"\n\n[project]\nname = "pkg"\nversion = "1.0.0"\n'
+        )
+        assert get_pyproject_version(path) == "1.0.0"
+
+    def test_missing_version(self, tmp_path: Path) -> None:
+        """Raise ValueError when the project has no version."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "pkg"\n\n[tool.other]\nversion = "9.9.9"\n')
+        with pytest.raises(ValueError, match="No version found"):
+            get_pyproject_version(path)
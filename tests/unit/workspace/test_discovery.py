@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from pymelos.config import PyMelosConfig
+from pymelos.errors import ConfigurationError
 from pymelos.workspace.discovery import (
     discover_packages,
     expand_package_patterns,
@@ -80,6 +83,19 @@ class TestExpandPackagePatterns:
         assert len(result) == 1
         assert result[0].name == "keep-pkg"
 
+    def test_ignore_relative_path_pattern(self, tmp_path: Path) -> None:
+        """Ignore patterns also match the path relative to the root."""
+        create_package_dir(tmp_path / "packages" / "app", "app")
+        create_package_dir(tmp_path / "libs" / "app-lib", "app-lib")
+
+        result = expand_package_patterns(
+            tmp_path,
+            ["packages/*", "libs/*"],
+            ignore_patterns=["libs/*"],
+        )
+
+        assert [p.name for p in result] == ["app"]
+
     def test_nested_pattern(self, tmp_path: Path) -> None:
         """Nested glob patterns work."""
         create_package_dir(tmp_path / "apps" / "web" / "frontend", "frontend")
@@ -168,6 +184,29 @@ class TestDiscoverPackages:
 
         assert packages["my-pkg"].path.resolve() == pkg_path.resolve()
 
+    def test_ordered_by_package_name(self, tmp_path: Path) -> None:
+        """Packages are keyed in name order, not directory order."""
+        packages_dir = tmp_path / "packages"
+        create_package_dir(packages_dir / "a-dir", "zeta")
+        create_package_dir(packages_dir / "b-dir", "alpha")
+
+        config = PyMelosConfig(name="test", packages=["packages/*"])
+        packages = discover_packages(tmp_path, config)
+
+        assert list(packages) == ["alpha", "zeta"]
+
+    def test_invalid_package_raises(self, tmp_path: Path) -> None:
+        """An invalid pyproject.toml among several packages is reported."""
+        packages_dir = tmp_path / "packages"
+        create_package_dir(packages_dir / "good", "good")
+        bad_dir = packages_dir / "bad"
+        bad_dir.mkdir(parents=True)
+        (bad_dir / "pyproject.toml").write_text("invalid [ toml")
+
+        config = PyMelosConfig(name="test", packages=["packages/*"])
+        with pytest.raises(ConfigurationError, match="Invalid pyproject.toml"):
+            discover_packages(tmp_path, config)
+
     def test_empty_workspace(self, tmp_path: Path) -> None:
         """Empty workspace returns empty dict."""
         (tmp_path / "packages").mkdir()
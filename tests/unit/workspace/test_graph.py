@@ -110,6 +110,16 @@ class TestDependencies:
         dep_names = {p.name for p in deps}
         assert dep_names == {"pkg-b", "pkg-c"}
 
+    def test_dependencies_match_normalized_names(self) -> None:
+        """Normalized dependency names resolve to the real package names."""
+        app = make_package("app", ["my_lib"])
+        lib = make_package("My-Lib")
+
+        graph = DependencyGraph(packages={"app": app, "My-Lib": lib})
+
+        assert graph.get_dependencies("app") == [lib]
+        assert graph.get_dependents("My-Lib") == [app]
+
     def test_get_dependents(self) -> None:
         """Get packages that depend on a package."""
         pkg_a = make_package("pkg-a", ["pkg-b"])
@@ -164,6 +174,39 @@ class TestDependencies:
         trans_names = {p.name for p in trans_deps}
         assert trans_names == {"pkg-a", "pkg-b"}
 
+    def test_transitive_queries_are_repeatable(self) -> None:
+        """Repeated transitive queries return the same packages."""
+        pkg_a = make_package("pkg-a", ["pkg-b"])
+        pkg_b = make_package("pkg-b", ["pkg-c"])
+        pkg_c = make_package("pkg-c")
+
+        graph = DependencyGraph(packages={"pkg-a": pkg_a, "pkg-b": pkg_b, "pkg-c": pkg_c})
+
+        first = {p.name for p in graph.get_transitive_dependents("pkg-c")}
+        second = {p.name for p in graph.get_transitive_dependents("pkg-c")}
+        assert first == second == {"pkg-a", "pkg-b"}
+        assert graph.get_transitive_dependencies("pkg-c") == []
+
+    def test_get_transitive_dependents_of_many(self) -> None:
+        """Dependents of several packages exclude the seed packages."""
+        pkg_a = make_package("pkg-a", ["pkg-b"])
+        pkg_b = make_package("pkg-b", ["pkg-c"])
+        pkg_c = make_package("pkg-c")
+        pkg_d = make_package("pkg-d", ["pkg-c"])
+
+        graph = DependencyGraph(
+            packages={
+                "pkg-a": pkg_a,
+                "pkg-b": pkg_b,
+                "pkg-c": pkg_c,
+                "pkg-d": pkg_d,
+            }
+        )
+
+        trans_deps = graph.get_transitive_dependents_of(["pkg-b", "pkg-c"])
+        trans_names = {p.name for p in trans_deps}
+        assert trans_names == {"pkg-a", "pkg-d"}
+
 
 class TestAffectedPackages:
     """Tests for get_affected_packages()."""
@@ -196,6 +239,17 @@ class TestAffectedPackages:
         affected_names = {p.name for p in affected}
         assert affected_names == {"pkg-a", "pkg-b", "pkg-c"}
 
+    def test_affected_shared_dependents_and_unknown_names(self) -> None:
+        """Shared dependents appear once and unknown names are ignored."""
+        pkg_a = make_package("pkg-a", ["pkg-b", "pkg-c"])
+        pkg_b = make_package("pkg-b")
+        pkg_c = make_package("pkg-c")
+
+        graph = DependencyGraph(packages={"pkg-a": pkg_a, "pkg-b": pkg_b, "pkg-c": pkg_c})
+
+        affected = graph.get_affected_packages({"pkg-b", "pkg-c", "missing"})
+        assert sorted(p.name for p in affected) == ["pkg-a", "pkg-b", "pkg-c"]
+
 
 class TestTopologicalOrder:
     """Tests for topological ordering."""
@@ -221,6 +275,19 @@ class TestTopologicalOrder:
         assert names.index("pkg-c") < names.index("pkg-b")
         assert names.index("pkg-b") < names.index("pkg-a")
 
+    def test_orders_agree_across_calls(self) -> None:
+        """Repeated traversals reuse one ordering consistent across methods."""
+        pkg_a = make_package("pkg-a", ["pkg-c"])
+        pkg_b = make_package("pkg-b", ["pkg-c"])
+        pkg_c = make_package("pkg-c")
+
+        graph = DependencyGraph(packages={"pkg-a": pkg_a, "pkg-b": pkg_b, "pkg-c": pkg_c})
+
+        order = list(graph.topological_order())
+        assert list(graph.topological_order()) == order
+        assert [p for batch in graph.parallel_batches() for p in batch] == order
+        assert list(graph.reverse_topological_order()) == order[::-1]
+
     def test_parallel_batches(self) -> None:
         """Parallel batches group independent packages."""
         pkg_a = make_package("pkg-a", ["pkg-c"])
@@ -290,6 +357,14 @@ class TestCyclicDependency:
         with pytest.raises(CyclicDependencyError):
             list(graph.topological_order())
 
+    def test_self_dependency_ignored(self) -> None:
+        """A package listing itself does not form a cycle."""
+        pkg = make_package("pkg-a", ["pkg-a"])
+        graph = DependencyGraph(packages={"pkg-a": pkg})
+
+        assert list(graph.topological_order()) == [pkg]
+        assert graph.get_dependents("pkg-a") == []
+
     def test_parallel_batches_detects_cycle(self) -> None:
         """parallel_batches also detects cycles."""
         pkg_a = make_package("pkg-a", ["pkg-b"])
@@ -11,6 +11,7 @@ from pymelos.workspace.package import (
     Package,
     get_package_name_from_path,
     load_package,
+    load_package_from_data,
     parse_dependency_name,
 )
 
@@ -33,6 +34,11 @@ class TestParseDependencyName:
         assert parse_dependency_name("requests[security]") == "requests"
         assert parse_dependency_name("sqlalchemy[postgresql]>=2.0") == "sqlalchemy"
 
+    def test_with_marker_and_parenthesized_version(self) -> None:
+        """Environment markers and parenthesized versions are dropped."""
+        assert parse_dependency_name("tomli>=2.0; python_version < '3.11'") == "tomli"
+        assert parse_dependency_name("pkg (>=1.0)") == "pkg"
+
     def test_with_url(self) -> None:
         """Package with URL source."""
         assert parse_dependency_name("my-pkg @ file:///path/to/pkg") == "my_pkg"
@@ -66,6 +72,11 @@ class TestPackage:
         assert pkg.src_path == Path("/pkg/src")
         assert pkg.tests_path == Path("/pkg/tests")
 
+    def test_normalized_name(self) -> None:
+        """normalized_name lowercases and replaces dashes."""
+        pkg = Package(name="My-Pkg", path=Path("/pkg"), version="1.0.0")
+        assert pkg.normalized_name == "my_pkg"
+
     def test_has_dependency(self) -> None:
         """Check if package has a dependency."""
         pkg = Package(
@@ -222,6 +233,48 @@ dependencies = ["provider-pkg"]
         pkg = load_package(tmp_path, workspace_packages={"provider_pkg"})
         assert "provider_pkg" in pkg.workspace_dependencies
 
+    def test_load_package_sees_edits(self, tmp_path: Path) -> None:
+        """Cached pyproject data is invalidated when the file changes."""
+        import os
+
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "pkg"\nversion = "1.0.0"\n')
+        assert load_package(tmp_path).version == "1.0.0"
+
+        pyproject.write_text('[project]\nname = "pkg"\nversion = "2.0.0"\n')
+        stat = pyproject.stat()
+        os.utime(pyproject, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_package(tmp_path).version == "2.0.0"
+
+
+class TestLoadPackageFromData:
+    """Tests for load_package_from_data()."""
+
+    def test_builds_package_without_reading_disk(self, tmp_path: Path) -> None:
+        """Package is built from the given data; no pyproject.toml is needed."""
+        data = {
+            "project": {"name": "consumer", "version": "2.0.0", "dependencies": ["core>=1"]},
+        }
+
+        pkg = load_package_from_data(tmp_path, data, {"core"})
+
+        assert pkg.name == "consumer"
+        assert pkg.version == "2.0.0"
+        assert pkg.workspace_dependencies == frozenset({"core"})
+
+    def test_resolved_path_used_as_is(self, tmp_path: Path) -> None:
+        """resolved=True keeps the given path instead of resolving it again."""
+        path = tmp_path / "pkg" / ".."
+        data = {"project": {"name": "pkg"}}
+
+        assert load_package_from_data(path, data).path == tmp_path.resolve()
+        assert load_package_from_data(path, data, resolved=True).path == path
+
+    def test_missing_project_section(self, tmp_path: Path) -> None:
+        """Raise error when the data has no [project] section."""
+        with pytest.raises(ConfigurationError, match="missing \\[project\\]"):
+            load_package_from_data(tmp_path, {})
+
 
 class TestGetPackageNameFromPath:
     """Tests for get_package_name_from_path()."""
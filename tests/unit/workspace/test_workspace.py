@@ -196,6 +196,43 @@ class TestWorkspaceFilterPackages:
         assert "a" in names
         assert "c" in names
 
+    def test_filter_by_literal_scope(self, tmp_path: Path) -> None:
+        """Literal scope names match case-insensitively and across - and _."""
+        workspace_root = create_workspace(
+            tmp_path,
+            [("api-svc", None), ("web_ui", None), ("other", None)],
+        )
+        workspace = Workspace.from_config(workspace_root / "pymelos.yaml")
+
+        result = workspace.filter_packages(scope="web-ui, API-SVC, missing")
+
+        assert [p.name for p in result] == ["api-svc", "web_ui"]
+
+    def test_filter_by_exact_names_keeps_workspace_order(self, tmp_path: Path) -> None:
+        """Exact-name selection ignores unknown names and keeps workspace order."""
+        workspace_root = create_workspace(tmp_path, [("a", None), ("b", None), ("c", None)])
+        workspace = Workspace.from_config(workspace_root / "pymelos.yaml")
+
+        result = workspace.filter_packages_by_exact_names(["c", "x", "a"])
+
+        assert [p.name for p in result] == ["a", "c"]
+
+    def test_filter_sees_packages_changed_after_first_use(self, tmp_path: Path) -> None:
+        """Name lookups follow packages when it is mutated or reassigned."""
+        workspace_root = create_workspace(tmp_path, [("a", None), ("b", None)])
+        workspace = Workspace.from_config(workspace_root / "pymelos.yaml")
+        assert [p.name for p in workspace.filter_packages(scope="a,b")] == ["a", "b"]
+
+        del workspace.packages["a"]
+        assert [p.name for p in workspace.filter_packages(scope="a,b")] == ["b"]
+        assert "a" not in workspace
+        assert workspace.has_package("a") is False
+
+        workspace.packages = {}
+        assert workspace.filter_packages_by_exact_names(["b"]) == []
+        with pytest.raises(PackageNotFoundError):
+            workspace.get_package("b")
+
 
 class TestWorkspaceTopologicalOrder:
     """Tests for Workspace.topological_order()."""
@@ -238,6 +275,14 @@ class TestWorkspaceTopologicalOrder:
         # core should come before app (app depends on core)
         assert names.index("core") < names.index("app")
 
+    def test_topological_order_full_selection(self, tmp_path: Path) -> None:
+        """Selecting every package orders them exactly like the full graph."""
+        workspace_root = create_workspace(tmp_path, [("core", None), ("app", ["core"])])
+        workspace = Workspace.from_config(workspace_root / "pymelos.yaml")
+
+        selected = list(workspace.packages.values())
+        assert list(workspace.topological_order(selected)) == list(workspace.topological_order())
+
 
 class TestWorkspaceParallelBatches:
     """Tests for Workspace.parallel_batches()."""
@@ -315,6 +360,7 @@ class TestWorkspaceRefresh:
         workspace = Workspace.from_config(workspace_root / "pymelos.yaml")
 
         assert len(workspace.packages) == 1
+        assert "new-pkg" not in workspace
 
         # Add a new package
         create_package_dir(workspace_root / "packages" / "new-pkg", "new-pkg")
@@ -323,6 +369,31 @@ class TestWorkspaceRefresh:
 
         assert len(workspace.packages) == 2
         assert "new-pkg" in workspace.packages
+        assert "new-pkg" in workspace
+        assert workspace.has_package("new-pkg")
+
+    def test_refresh_reuses_unchanged_pyproject_data(self, tmp_path: Path) -> None:
+        """Unchanged pyproject.toml files are not re-parsed unless the cache is cleared."""
+        import os
+
+        from pymelos.workspace.package import _load_toml
+
+        workspace_root = create_workspace(tmp_path, [("pkg", None)])
+        # Files modified within the last moment are never cached; age this one
+        pyproject = workspace_root / "packages" / "pkg" / "pyproject.toml"
+        os.utime(pyproject, (1_600_000_000, 1_600_000_000))
+        workspace = Workspace.from_config(workspace_root / "pymelos.yaml")
+        original = workspace.packages["pkg"]
+
+        hits = _load_toml.cache_info().hits
+        workspace.refresh()
+        assert workspace.packages["pkg"] == original
+        assert _load_toml.cache_info().hits == hits + 1
+
+        # Clearing also resets the cache statistics, leaving only the re-parse
+        workspace.refresh(clear_cache=True)
+        assert workspace.packages["pkg"] == original
+        assert _load_toml.cache_info().misses == 1
 
 
 class TestWorkspaceDunderMethods: